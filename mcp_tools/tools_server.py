@@ -1,46 +1,99 @@
 # tools_server.py
 
-from mcp.server.fastmcp import FastMCP
+import functools
 import os
-
-# Initialize the MCP server
-mcp = FastMCP("tools-server")
-
 import sys
 from typing import Any, List, Dict
 
+# Tools registered with the MCP server when it starts
+TOOLS = []
+
+# Log each tool name once, even if the module registers it again
+@functools.cache
+def _log_registration(name: str) -> None:
+    print(f"Registered tool: {name}", file=sys.stderr)
+
 # Logging tool registrations with decorator
 def log_tool_registration(tool):
-    print(f"Registered tool: {tool.__name__}", file=sys.stderr)
+    _log_registration(tool.__name__)
+    if tool not in TOOLS:
+        TOOLS.append(tool)
     return tool
 
 # Tool: Sum two numbers
-@mcp.tool()
 @log_tool_registration
 def generate_sum(a: float, b: float) -> float:
     """Add two numbers."""
     return a + b
 
-# Tool: Analyze text
-@mcp.tool()
-@log_tool_registration
-def analyze_text(text: str) -> dict[str, Any]:
-    """Analyze text for word count and unique words."""
+# Texts at least this long are analyzed without caching. Cached texts are
+# kept alive by the cache, so this and the cache size bound its memory to
+# about 1 MiB of text
+ANALYZE_CACHE_LIMIT = 4 * 1024
+ANALYZE_CACHE_SIZE = 256
+
+def _count_words(text: str) -> dict[str, Any]:
     words = text.split()
     return {
         "word_count": len(words),
         "unique_words": len(set(words))
     }
 
+_count_words_cached = functools.lru_cache(maxsize=ANALYZE_CACHE_SIZE)(_count_words)
+
+# Tool: Analyze text
+@log_tool_registration
+def analyze_text(text: str) -> dict[str, Any]:
+    """Analyze text for word count and unique words."""
+    if len(text) < ANALYZE_CACHE_LIMIT:
+        return dict(_count_words_cached(text))
+    return _count_words(text)
+
+# Directory listings are cached until the directory's mtime changes
+@functools.lru_cache(maxsize=128)
+def _scan_files(directory: str, mtime_ns: int) -> tuple[str, ...]:
+    with os.scandir(directory) as it:
+        return tuple(entry.name for entry in it if entry.is_file())
+
 # Tool: List files in a directory
-@mcp.tool()
 @log_tool_registration
 def list_files(directory: str) -> list[str]:
     """List all files in a directory."""
-    try:
-        return [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-    except Exception as e:
-        return {"error": str(e)}
+    # Errors propagate so FastMCP reports them as tool errors
+    return list(_scan_files(directory, os.stat(directory).st_mtime_ns))
+
+def build_server():
+    # Import FastMCP only when serving so introspecting the tools stays cheap
+    from mcp.server.fastmcp import FastMCP
+
+    # Initialize the MCP server
+    mcp = FastMCP("tools-server")
+    for tool in TOOLS:
+        mcp.tool()(tool)
+    return mcp
+
+# `mcp run tools_server.py` and `mcp dev tools_server.py` look the server up as
+# the module attribute `mcp`; it is built on first access and then kept
+def get_server():
+    if "mcp" not in globals():
+        globals()["mcp"] = build_server()
+    return globals()["mcp"]
+
+def __getattr__(name: str) -> Any:
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Serve every tool call for the lifetime of one stdio session. Clients should
+# connect once and reuse the session for many calls rather than spawning the
+# server per call, which pays process startup and the MCP handshake each time.
+def serve(transport: str = "stdio"):
+    mcp = get_server()
+    print("Starting MCP Tools Server", file=sys.stderr)
+    mcp.run(transport=transport)
+
+def main():
+    serve()
 
-print("Starting MCP Tools Server", file=sys.stderr)
-mcp.run(transport="stdio")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
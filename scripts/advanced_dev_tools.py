@@ -5,18 +5,15 @@ Script for advanced development operations using AdvancedDeveloperTools.
 
 import argparse
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import Any, List, Optional
 
-from mcp.tools.integrated import AdvancedDeveloperTools, MemoryTool
+from cli_utils import iso_from_ns, parsed_args
+from pool_daemon import get_pooled_tool
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="MCP Advanced Development Tools")
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-
-    # Test command
+def _add_test_parser(subparsers: argparse._SubParsersAction):
     test_parser = subparsers.add_parser("test", help="Run tests")
     test_parser.add_argument(
         "--type",
@@ -30,7 +27,8 @@ def parse_args() -> argparse.Namespace:
         help="Additional test arguments"
     )
 
-    # Lint command
+
+def _add_lint_parser(subparsers: argparse._SubParsersAction):
     lint_parser = subparsers.add_parser("lint", help="Run linting")
     lint_parser.add_argument(
         "--type",
@@ -44,7 +42,8 @@ def parse_args() -> argparse.Namespace:
         help="Automatically fix issues where possible"
     )
 
-    # Docs command
+
+def _add_docs_parser(subparsers: argparse._SubParsersAction):
     docs_parser = subparsers.add_parser("docs", help="Build documentation")
     docs_parser.add_argument(
         "--type",
@@ -58,7 +57,8 @@ def parse_args() -> argparse.Namespace:
         help="Serve documentation after building"
     )
 
-    # Container command
+
+def _add_container_parser(subparsers: argparse._SubParsersAction):
     container_parser = subparsers.add_parser("container", help="Container operations")
     container_parser.add_argument(
         "--op",
@@ -72,6 +72,40 @@ def parse_args() -> argparse.Namespace:
         help="Additional container arguments"
     )
 
+
+SUBCOMMANDS = {
+    "test": _add_test_parser,
+    "lint": _add_lint_parser,
+    "docs": _add_docs_parser,
+    "container": _add_container_parser,
+}
+
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Find the subcommand in argv when it is unambiguous, else None."""
+    for i, arg in enumerate(argv):
+        if arg in ("-h", "--help"):
+            return None
+        if arg in SUBCOMMANDS:
+            # A preceding option may be consuming this token as its value
+            return arg if i == 0 or not argv[i - 1].startswith("-") else None
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Only the invoked subcommand's parser is built when it can be identified
+    up front; help and ambiguous command lines build all of them.
+    """
+    parser = argparse.ArgumentParser(description="MCP Advanced Development Tools")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    command = _peek_command(sys.argv[1:])
+    for name, add_parser in SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+
     # Common options
     parser.add_argument(
         "--workspace",
@@ -92,100 +126,140 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _handle_test(
+    args: argparse.Namespace,
+    adv_tool: Any,
+    out: List[str],
+    err: List[str]
+) -> Any:
+    result = adv_tool(
+        operation="test",
+        test_type=args.type,
+        extra_args=args.args or [],
+        store_results=args.store_results
+    )
+    if result.success:
+        if "coverage" in result.data:
+            out.append(f"\nCoverage report: {result.data['coverage_report']}\n")
+        if "tox" in result.data:
+            out.append(f"\nTox Results:\n{result.data['tox']['stdout']}\n")
+    return result
+
+
+def _handle_lint(
+    args: argparse.Namespace,
+    adv_tool: Any,
+    out: List[str],
+    err: List[str]
+) -> Any:
+    result = adv_tool(
+        operation="lint",
+        lint_type=args.type,
+        write=args.fix,
+        store_results=args.store_results
+    )
+    if result.success:
+        for linter, data in result.data.items():
+            if data is None:
+                # The linter's command could not be run, usually because it
+                # is not installed
+                err.append(f"{linter.upper()} could not be run; is it installed?\n")
+                continue
+            out.append(f"\n{linter.upper()} Results:\n{data['stdout']}\n")
+            if data["stderr"]:
+                err.append(f"Errors:\n{data['stderr']}\n")
+    return result
+
+
+def _handle_docs(
+    args: argparse.Namespace,
+    adv_tool: Any,
+    out: List[str],
+    err: List[str]
+) -> Any:
+    result = adv_tool(
+        operation="docs",
+        doc_type=args.type,
+        extra_args=["--serve"] if args.serve else []
+    )
+    if result.success and "docs_path" in result.data:
+        out.append(f"\nDocumentation built at: {result.data['docs_path']}\n")
+        if args.serve:
+            out.append("Documentation server started\n")
+    return result
+
+
+def _handle_container(
+    args: argparse.Namespace,
+    adv_tool: Any,
+    out: List[str],
+    err: List[str]
+) -> Any:
+    result = adv_tool(
+        operation="container",
+        container_op=args.op,
+        extra_args=args.args or []
+    )
+    if result.success:
+        out.append(f"\n{args.op.title()} Results:\n{result.data[args.op]['stdout']}\n")
+        if result.data[args.op]["stderr"]:
+            err.append(f"Errors:\n{result.data[args.op]['stderr']}\n")
+    return result
+
+
+HANDLERS = {
+    "test": _handle_test,
+    "lint": _handle_lint,
+    "docs": _handle_docs,
+    "container": _handle_container,
+}
+
+
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parsed_args(parse_args)
+
+    handler = HANDLERS.get(args.command)
+    if handler is None:
+        print("No command specified", file=sys.stderr)
+        return 1
 
     # Initialize tools
-    memory_tool = MemoryTool(
+    memory_tool = get_pooled_tool(
+        "memory",
         storage_dir=args.memory_dir
-    ) if args.memory_dir else MemoryTool()
-
-    adv_tool = AdvancedDeveloperTools(
+    ) if args.store_results else None
+    adv_tool = get_pooled_tool(
+        "advanced-dev",
         workspace_root=args.workspace or Path.cwd(),
-        memory_tool=memory_tool
+        memory_dir=args.memory_dir
     )
 
-    timestamp = datetime.utcnow().isoformat()
+    timestamp = iso_from_ns(time.time_ns())
 
     try:
-        if args.command == "test":
-            result = adv_tool(
-                operation="test",
-                test_type=args.type,
-                extra_args=args.args or [],
-                store_results=args.store_results
-            )
-
-        elif args.command == "lint":
-            result = adv_tool(
-                operation="lint",
-                lint_type=args.type,
-                extra_args=["--fix"] if args.fix else [],
-                store_results=args.store_results
-            )
-
-        elif args.command == "docs":
-            result = adv_tool(
-                operation="docs",
-                doc_type=args.type,
-                extra_args=["--serve"] if args.serve else []
-            )
-
-        elif args.command == "container":
-            result = adv_tool(
-                operation="container",
-                container_op=args.op,
-                extra_args=args.args or []
-            )
-
-        else:
-            print("No command specified", file=sys.stderr)
-            return 1
+        # Collect output and write each stream once
+        out = ["Operation completed successfully\n"]
+        err = []
+        result = handler(args, adv_tool, out, err)
 
         # Handle result
         if result.success:
-            print("Operation completed successfully")
-
-            # Print operation-specific results
-            if args.command == "test":
-                if "coverage" in result.data:
-                    print(f"\nCoverage report: {result.data['coverage_report']}")
-                if "tox" in result.data:
-                    print("\nTox Results:")
-                    print(result.data["tox"]["stdout"])
-
-            elif args.command == "lint":
-                for linter, data in result.data.items():
-                    print(f"\n{linter.upper()} Results:")
-                    print(data["stdout"])
-                    if data["stderr"]:
-                        print("Errors:", file=sys.stderr)
-                        print(data["stderr"], file=sys.stderr)
-
-            elif args.command == "docs":
-                if "docs_path" in result.data:
-                    print(f"\nDocumentation built at: {result.data['docs_path']}")
-                    if args.serve:
-                        print("Documentation server started")
-
-            elif args.command == "container":
-                print(f"\n{args.op.title()} Results:")
-                print(result.data[args.op]["stdout"])
-                if result.data[args.op]["stderr"]:
-                    print("Errors:", file=sys.stderr)
-                    print(result.data[args.op]["stderr"], file=sys.stderr)
-
             # Store results if requested
             if args.store_results:
+                key = f"{args.command}_{args.type}_{timestamp}"
                 memory_tool(
                     operation="store",
-                    key=f"{args.command}_{args.type}_{timestamp}",
+                    key=key,
                     data=result.data,
                     tags=[args.command, args.type, timestamp[:10]]
                 )
-                print(f"\nResults stored with key: {args.command}_{args.type}_{timestamp}")
+                out.append(f"\nResults stored with key: {key}\n")
 
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+            if err:
+                sys.stderr.write("".join(err))
             return 0
         else:
             print(f"Error: {result.error}", file=sys.stderr)
@@ -200,4 +274,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the development scripts.
+"""
+
+import argparse
+import functools
+from datetime import datetime, timezone
+from typing import Callable
+
+
+@functools.lru_cache(maxsize=1)
+def parsed_args(parse: Callable[[], argparse.Namespace]) -> argparse.Namespace:
+    """Parse command line arguments with parse once per process."""
+    return parse()
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    """Format a UTC epoch second, reusing the result within the same second."""
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def iso_from_ns(ts_ns: int) -> str:
+    """Format an epoch timestamp in nanoseconds as an ISO 8601 UTC string."""
+    seconds, ns = divmod(ts_ns, 1_000_000_000)
+    return f"{_iso_second(seconds)}.{ns // 1000:06d}+00:00"
@@ -5,26 +5,38 @@ Script for common development operations using DeveloperTool.
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, List, Optional
 
-from mcp.tools.integrated import DeveloperTool
+from cli_utils import parsed_args
+from pool_daemon import get_pooled_tool
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="MCP Development Tools")
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-
-    # Shell command
+def _add_shell_parser(subparsers: argparse._SubParsersAction):
     shell_parser = subparsers.add_parser("shell", help="Execute shell command")
-    shell_parser.add_argument("cmd", help="Command to execute")
+    shell_parser.add_argument(
+        "cmd",
+        nargs="*",
+        help="Command to execute"
+    )
+    shell_parser.add_argument(
+        "--cmd",
+        dest="batch",
+        action="append",
+        default=[],
+        metavar="COMMAND",
+        help="Additional command to execute; repeat to submit several at once"
+    )
+
 
-    # Edit file
+def _add_edit_parser(subparsers: argparse._SubParsersAction):
     edit_parser = subparsers.add_parser("edit", help="Edit file")
     edit_parser.add_argument("file", help="File to edit")
     edit_parser.add_argument("content", help="New content")
 
-    # Run tests
+
+def _add_test_parser(subparsers: argparse._SubParsersAction):
     test_parser = subparsers.add_parser("test", help="Run tests")
     test_parser.add_argument(
         "path",
@@ -38,6 +50,39 @@ def parse_args() -> argparse.Namespace:
         help="Verbose output"
     )
 
+
+SUBCOMMANDS = {
+    "shell": _add_shell_parser,
+    "edit": _add_edit_parser,
+    "test": _add_test_parser,
+}
+
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Find the subcommand in argv when it is unambiguous, else None."""
+    for i, arg in enumerate(argv):
+        if arg in ("-h", "--help"):
+            return None
+        if arg in SUBCOMMANDS:
+            # A preceding option may be consuming this token as its value
+            return arg if i == 0 or not argv[i - 1].startswith("-") else None
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Only the invoked subcommand's parser is built when it can be identified
+    up front; help and ambiguous command lines build all of them.
+    """
+    parser = argparse.ArgumentParser(description="MCP Development Tools")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    command = _peek_command(sys.argv[1:])
+    for name, add_parser in SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+
     # Common options
     parser.add_argument(
         "--workspace",
@@ -48,62 +93,91 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _print_shell_result(result: Any) -> int:
+    if result.success:
+        print(result.data["stdout"])
+        if result.data["stderr"]:
+            print(result.data["stderr"], file=sys.stderr)
+        return result.data["returncode"]
+    else:
+        print(f"Error: {result.error}", file=sys.stderr)
+        return 1
+
+
+def _handle_shell(args: argparse.Namespace, dev_tool: Any) -> int:
+    commands = ([" ".join(args.cmd)] if args.cmd else []) + args.batch
+    if not commands:
+        print("No shell command given", file=sys.stderr)
+        return 1
+
+    if len(commands) == 1:
+        return _print_shell_result(dev_tool(operation="shell", command=commands[0]))
+
+    # Submitted together so they can overlap; a pooled tool runs them in turn
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        results = list(executor.map(
+            lambda command: dev_tool(operation="shell", command=command),
+            commands
+        ))
+    returncodes = [_print_shell_result(result) for result in results]
+    return next((code for code in returncodes if code), 0)
+
+
+def _handle_edit(args: argparse.Namespace, dev_tool: Any) -> int:
+    result = dev_tool(
+        operation="edit",
+        file_path=args.file,
+        content=args.content
+    )
+    if result.success:
+        print(f"Successfully edited {result.data['path']}")
+        print(f"File size: {result.data['size']} bytes")
+        return 0
+    else:
+        print(f"Error: {result.error}", file=sys.stderr)
+        return 1
+
+
+def _handle_test(args: argparse.Namespace, dev_tool: Any) -> int:
+    extra_args = ["-v"] if args.verbose else []
+    result = dev_tool(
+        operation="test",
+        extra_args=[args.path, *extra_args]
+    )
+    if result.success:
+        print(result.data["stdout"])
+        if result.data["stderr"]:
+            print(result.data["stderr"], file=sys.stderr)
+        return result.data["returncode"]
+    else:
+        print(f"Error: {result.error}", file=sys.stderr)
+        return 1
+
+
+HANDLERS = {
+    "shell": _handle_shell,
+    "edit": _handle_edit,
+    "test": _handle_test,
+}
+
+
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parsed_args(parse_args)
+
+    handler = HANDLERS.get(args.command)
+    if handler is None:
+        print("No command specified", file=sys.stderr)
+        return 1
 
     # Initialize tool
-    dev_tool = DeveloperTool(
+    dev_tool = get_pooled_tool(
+        "dev",
         workspace_root=args.workspace or Path.cwd()
     )
 
     try:
-        if args.command == "shell":
-            result = dev_tool(
-                operation="shell",
-                command=args.cmd
-            )
-            if result.success:
-                print(result.data["stdout"])
-                if result.data["stderr"]:
-                    print(result.data["stderr"], file=sys.stderr)
-                return result.data["returncode"]
-            else:
-                print(f"Error: {result.error}", file=sys.stderr)
-                return 1
-
-        elif args.command == "edit":
-            result = dev_tool(
-                operation="edit",
-                file_path=args.file,
-                content=args.content
-            )
-            if result.success:
-                print(f"Successfully edited {result.data['path']}")
-                print(f"File size: {result.data['size']} bytes")
-                return 0
-            else:
-                print(f"Error: {result.error}", file=sys.stderr)
-                return 1
-
-        elif args.command == "test":
-            extra_args = ["-v"] if args.verbose else []
-            result = dev_tool(
-                operation="test",
-                extra_args=[args.path, *extra_args]
-            )
-            if result.success:
-                print(result.data["stdout"])
-                if result.data["stderr"]:
-                    print(result.data["stderr"], file=sys.stderr)
-                return result.data["returncode"]
-            else:
-                print(f"Error: {result.error}", file=sys.stderr)
-                return 1
-
-        else:
-            print("No command specified", file=sys.stderr)
-            return 1
+        return handler(args, dev_tool)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
@@ -114,4 +188,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -7,17 +7,15 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
-from mcp.tools.integrated import MemoryTool
+import orjson
 
+from cli_utils import parsed_args
+from pool_daemon import get_pooled_tool
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="MCP Memory Tools")
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
-    # Store command
+def _add_store_parser(subparsers: argparse._SubParsersAction):
     store_parser = subparsers.add_parser("store", help="Store data")
     store_parser.add_argument("key", help="Key for the data")
     store_parser.add_argument(
@@ -30,7 +28,8 @@ def parse_args() -> argparse.Namespace:
         help="Tags for the data"
     )
 
-    # Retrieve command
+
+def _add_retrieve_parser(subparsers: argparse._SubParsersAction):
     retrieve_parser = subparsers.add_parser("retrieve", help="Retrieve data")
     retrieve_parser.add_argument("key", help="Key to retrieve")
     retrieve_parser.add_argument(
@@ -39,7 +38,8 @@ def parse_args() -> argparse.Namespace:
         help="Output file (default: stdout)"
     )
 
-    # List command
+
+def _add_list_parser(subparsers: argparse._SubParsersAction):
     list_parser = subparsers.add_parser("list", help="List stored data")
     list_parser.add_argument(
         "--tag-filter",
@@ -53,10 +53,45 @@ def parse_args() -> argparse.Namespace:
         help="Output format"
     )
 
-    # Delete command
+
+def _add_delete_parser(subparsers: argparse._SubParsersAction):
     delete_parser = subparsers.add_parser("delete", help="Delete data")
     delete_parser.add_argument("key", help="Key to delete")
 
+
+SUBCOMMANDS = {
+    "store": _add_store_parser,
+    "retrieve": _add_retrieve_parser,
+    "list": _add_list_parser,
+    "delete": _add_delete_parser,
+}
+
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Find the subcommand in argv when it is unambiguous, else None."""
+    for i, arg in enumerate(argv):
+        if arg in ("-h", "--help"):
+            return None
+        if arg in SUBCOMMANDS:
+            # A preceding option may be consuming this token as its value
+            return arg if i == 0 or not argv[i - 1].startswith("-") else None
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Only the invoked subcommand's parser is built when it can be identified
+    up front; help and ambiguous command lines build all of them.
+    """
+    parser = argparse.ArgumentParser(description="MCP Memory Tools")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    command = _peek_command(sys.argv[1:])
+    for name, add_parser in SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
+
     # Common options
     parser.add_argument(
         "--storage-dir",
@@ -69,30 +104,32 @@ def parse_args() -> argparse.Namespace:
 
 def read_data(data_arg: str) -> Any:
     """Read data from argument or stdin."""
-    if data_arg == "-":
-        return json.load(sys.stdin)
-    return json.loads(data_arg)
+    buf = sys.stdin.buffer.read() if data_arg == "-" else data_arg.encode()
+    return orjson.loads(buf)
 
 
 def format_entry(entry: dict) -> str:
     """Format a memory entry for text output."""
+    data = orjson.dumps(entry['data'], option=orjson.OPT_INDENT_2).decode()
     return (
         f"Key: {entry['key']}\n"
         f"Tags: {', '.join(entry['tags'])}\n"
         f"Created: {entry['created_at']}\n"
         f"Updated: {entry['updated_at']}\n"
-        f"Data: {json.dumps(entry['data'], indent=2)}\n"
+        f"Data: {data}\n"
     )
 
 
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parsed_args(parse_args)
+
+    if not args.command:
+        print("No command specified", file=sys.stderr)
+        return 1
 
     # Initialize tool
-    memory_tool = MemoryTool(
-        storage_dir=args.storage_dir
-    ) if args.storage_dir else MemoryTool()
+    memory_tool = get_pooled_tool("memory", storage_dir=args.storage_dir)
 
     try:
         if args.command == "store":
@@ -132,15 +169,15 @@ def main() -> int:
                     print(f"No data found for key: {args.key}", file=sys.stderr)
                     return 1
 
-                # Format output
-                output = json.dumps(result.data, indent=2)
+                # Format output as bytes so it is written without re-encoding
+                output = orjson.dumps(result.data, option=orjson.OPT_INDENT_2)
 
                 # Write to file or stdout
                 if args.output:
-                    args.output.write_text(output)
+                    args.output.write_bytes(output)
                     print(f"Data written to: {args.output}")
                 else:
-                    print(output)
+                    sys.stdout.buffer.write(output + b"\n")
 
                 return 0
             else:
@@ -160,11 +197,12 @@ def main() -> int:
                     return 0
 
                 if args.format == "json":
-                    print(json.dumps(entries, indent=2))
+                    print(orjson.dumps(entries, option=orjson.OPT_INDENT_2).decode())
                 else:
-                    for entry in entries:
-                        print("-" * 40)
-                        print(format_entry(entry))
+                    sep = "-" * 40 + "\n"
+                    sys.stdout.write("".join(
+                        f"{sep}{format_entry(entry)}\n" for entry in entries
+                    ))
 
                 return 0
             else:
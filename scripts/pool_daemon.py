@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Pooled tool daemon sharing warm MCP tool instances across script invocations.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+
+def _default_socket_path() -> Path:
+    """Per-user socket path, in $XDG_RUNTIME_DIR when it is set."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "mcp-tools.sock"
+    return Path(tempfile.gettempdir()) / f"mcp-tools-{os.getuid()}.sock"
+
+
+SOCKET_PATH = Path(os.environ.get("MCP_POOL_SOCKET") or _default_socket_path())
+IDLE_TIMEOUT = 300.0
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """uid of the process at the other end of a UNIX socket, or None where
+    the platform doesn't report it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", creds)[1]
+
+
+@dataclass
+class PooledResult:
+    """Result of a tool call forwarded to the pool daemon."""
+    success: bool
+    data: Any = None
+    error: Optional[str] = None
+
+
+def _close_tool(tool: Any):
+    """Release the resources of a tool that has a close() method, such as
+    MemoryTool's database connection."""
+    close = getattr(tool, "close", None)
+    if close is not None:
+        close()
+
+
+def compute_config_hash(kind: str, **config: Any) -> str:
+    """Compute a stable hash identifying a tool kind and its configuration."""
+    payload = json.dumps(
+        {"kind": kind, "config": {k: str(v) for k, v in config.items() if v is not None}},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def build_tool(kind: str, **config: Any) -> Any:
+    """Construct an in-process tool instance."""
+    from mcp.tools.integrated import AdvancedDeveloperTools, DeveloperTool, MemoryTool
+
+    def path(key: str) -> Optional[Path]:
+        return Path(config[key]) if config.get(key) else None
+
+    if kind == "dev":
+        return DeveloperTool(workspace_root=path("workspace_root"))
+    if kind == "memory":
+        return MemoryTool(storage_dir=path("storage_dir"))
+    if kind == "advanced-dev":
+        memory_dir = path("memory_dir")
+        return AdvancedDeveloperTools(
+            workspace_root=path("workspace_root"),
+            memory_tool=MemoryTool(storage_dir=memory_dir) if memory_dir else None
+        )
+    raise ValueError(f"Unknown tool kind: {kind}")
+
+
+class PooledTool:
+    """Client-side proxy forwarding tool calls to the pool daemon."""
+
+    def __init__(self, sock: socket.socket, kind: str, config: Dict[str, Any]):
+        self._sock = sock
+        self._stream = sock.makefile("rwb")
+        self._lock = threading.Lock()
+        self.config_hash = self._request({
+            "op": "acquire",
+            "tool": kind,
+            "config": {k: str(v) for k, v in config.items() if v is not None},
+            "pid": os.getpid()
+        })["hash"]
+
+    def _request(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._stream.write(json.dumps(frame).encode() + b"\n")
+            self._stream.flush()
+            line = self._stream.readline()
+        if not line:
+            raise ConnectionError("Pool daemon closed the connection")
+        reply = json.loads(line)
+        if "error" in reply and "success" not in reply:
+            raise RuntimeError(reply["error"])
+        return reply
+
+    def __call__(self, **kwargs) -> PooledResult:
+        """Execute the pooled tool with the given arguments."""
+        return PooledResult(**self._request({"op": "call", "args": kwargs}))
+
+    def close(self):
+        """Release this caller's reference on the pooled instance."""
+        self._stream.close()
+        self._sock.close()
+
+
+def get_pooled_tool(kind: str, **config: Any) -> Any:
+    """Get a tool backed by the pool daemon, or an in-process instance if none runs.
+
+    Only a daemon run by the same user, on a socket only that user can
+    access, is used.
+
+    Args:
+        kind: Tool kind ('dev', 'memory', 'advanced-dev')
+        **config: Tool configuration (paths may be Path or str)
+    """
+    # Paths are resolved here, since the daemon has its own working directory
+    config = {
+        key: Path(value).expanduser().resolve() if value is not None else None
+        for key, value in config.items()
+    }
+
+    sock = _connect()
+    if sock is None:
+        return build_tool(kind, **config)
+    return PooledTool(sock, kind, config)
+
+
+def _connect() -> Optional[socket.socket]:
+    """Connect to this user's pool daemon, or None if there isn't one."""
+    try:
+        st = SOCKET_PATH.stat()
+    except FileNotFoundError:
+        return None
+    if st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(SOCKET_PATH))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    if _peer_uid(sock) not in (None, os.getuid()):
+        sock.close()
+        return None
+    return sock
+
+
+class ToolPool:
+    """Pool of tool instances keyed by configuration hash with caller refcounts.
+
+    An instance left without callers is kept warm for the idle timeout, so
+    sequential CLI calls reuse it.
+    """
+
+    def __init__(self, server: socketserver.BaseServer, idle_timeout: float):
+        self._server = server
+        self._idle_timeout = idle_timeout
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._callers: Dict[str, Set[int]] = {}
+        self._idle_since: Dict[str, float] = {}
+        self._connections = 0
+        self._lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+        self._arm_idle_timer()
+
+    def _arm_idle_timer(self):
+        self._idle_timer = threading.Timer(self._idle_timeout, self._server.shutdown)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def connect(self):
+        """Register a new client connection."""
+        with self._lock:
+            self._connections += 1
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def disconnect(self):
+        """Unregister a client connection, arming the idle timer when none remain."""
+        with self._lock:
+            self._connections -= 1
+            if self._connections == 0:
+                self._arm_idle_timer()
+
+    def acquire(self, kind: str, config: Dict[str, Any], pid: int) -> str:
+        """Get or create the instance for a configuration and track the caller."""
+        key = compute_config_hash(kind, **config)
+        with self._lock:
+            evicted = self._evict_idle()
+            self._idle_since.pop(key, None)
+            if key not in self._instances:
+                self._instances[key] = build_tool(kind, **config)
+                self._locks[key] = threading.Lock()
+                self._callers[key] = set()
+            self._callers[key].add(pid)
+        for tool in evicted:
+            _close_tool(tool)
+        return key
+
+    def release(self, key: str, pid: int):
+        """Drop a caller, marking the instance idle once it has no callers left."""
+        with self._lock:
+            callers = self._callers.get(key)
+            if callers is None:
+                return
+            callers.discard(pid)
+            if not callers:
+                self._idle_since[key] = time.monotonic()
+            evicted = self._evict_idle()
+        for tool in evicted:
+            _close_tool(tool)
+
+    def _evict_idle(self) -> List[Any]:
+        """Remove instances idle for longer than the idle timeout and return
+        them for the caller to close once _lock is released. Must be called
+        holding _lock."""
+        cutoff = time.monotonic() - self._idle_timeout
+        evicted = []
+        for key in [key for key, since in self._idle_since.items() if since <= cutoff]:
+            evicted.append(self._instances.pop(key))
+            del self._locks[key]
+            del self._callers[key]
+            del self._idle_since[key]
+        return evicted
+
+    def close(self):
+        """Close every pooled instance, for when the daemon shuts down."""
+        with self._lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            tools = list(self._instances.values())
+            self._instances.clear()
+            self._locks.clear()
+            self._callers.clear()
+            self._idle_since.clear()
+        for tool in tools:
+            _close_tool(tool)
+
+    def call(self, key: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a call on a pooled instance."""
+        with self._lock:
+            tool = self._instances[key]
+            lock = self._locks[key]
+        with lock:
+            result = tool(**args)
+        return {"success": result.success, "data": result.data, "error": result.error}
+
+
+class _PoolHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON frames from a single client."""
+
+    def handle(self):
+        pool = self.server.pool
+        key = None
+        pid = None
+        pool.connect()
+        try:
+            for line in self.rfile:
+                try:
+                    frame = json.loads(line)
+                    if frame["op"] == "acquire":
+                        pid = frame["pid"]
+                        key = pool.acquire(frame["tool"], frame.get("config", {}), pid)
+                        reply = {"hash": key}
+                    elif frame["op"] == "call" and key is not None:
+                        reply = pool.call(key, frame["args"])
+                    else:
+                        reply = {"error": f"Unexpected frame: {frame.get('op')}"}
+                except Exception as e:
+                    reply = {"error": str(e)}
+                self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+        finally:
+            if key is not None:
+                pool.release(key, pid)
+            pool.disconnect()
+
+
+class _PoolServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def verify_request(self, request: socket.socket, client_address: Any) -> bool:
+        """Serve only processes of the user running the daemon."""
+        return _peer_uid(request) in (None, os.getuid())
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="MCP Tool Pool Daemon")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=SOCKET_PATH,
+        help=f"UNIX socket path (default: {SOCKET_PATH})"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=IDLE_TIMEOUT,
+        help="Seconds without clients before the daemon exits"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    if args.socket.exists():
+        # Only replace a stale socket, never one a live daemon is serving
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(args.socket))
+        except ConnectionRefusedError:
+            args.socket.unlink()
+        else:
+            print(f"A tool pool is already listening on {args.socket}", file=sys.stderr)
+            return 1
+        finally:
+            probe.close()
+
+    # Create the socket accessible to this user only
+    umask = os.umask(0o177)
+    try:
+        server = _PoolServer(str(args.socket), _PoolHandler)
+    finally:
+        os.umask(umask)
+    os.chmod(args.socket, 0o600)
+
+    with server:
+        server.pool = ToolPool(server, args.idle_timeout)
+        print(f"Tool pool listening on {args.socket}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            args.socket.unlink(missing_ok=True)
+            server.pool.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
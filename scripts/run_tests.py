@@ -4,12 +4,14 @@ Script to run MCP test suite with different configurations and generate reports.
 """
 
 import argparse
+import asyncio
 import subprocess
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import Any, Dict, List
 
-from mcp.tools.integrated import AdvancedDeveloperTools, MemoryTool
+from cli_utils import iso_from_ns, parsed_args
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,8 +50,70 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+async def batch_execute(
+    ops: List[Dict[str, Any]],
+    max_concurrent: int = 4,
+    stop_on_error: bool = True
+) -> Dict[str, Any]:
+    """Execute tool operations as a single concurrent batch.
+
+    Each op is a dict with a ``name``, a ``tool`` callable and its ``kwargs``.
+    An op may list the names it ``depends_on``; it then starts only once those
+    ops have finished, and a callable ``kwargs`` is invoked with the results
+    gathered so far. Independent ops run concurrently, bounded by
+    ``max_concurrent``.
+
+    Args:
+        ops: Operations to execute
+        max_concurrent: Maximum number of operations running at once
+        stop_on_error: Skip operations not yet started once any operation raises
+
+    Returns:
+        Mapping of op name to its result, or to the exception it raised
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: Dict[str, Any] = {}
+    tasks: Dict[str, asyncio.Task] = {}
+    errored = False
+
+    async def run(op: Dict[str, Any]) -> Any:
+        nonlocal errored
+        dependencies = [tasks[name] for name in op.get("depends_on", [])]
+        if dependencies:
+            await asyncio.gather(*dependencies, return_exceptions=True)
+
+        async with semaphore:
+            if stop_on_error and errored:
+                return None
+
+            try:
+                kwargs = op["kwargs"]
+                if callable(kwargs):
+                    kwargs = kwargs(results)
+                result = await asyncio.to_thread(op["tool"], **kwargs)
+            except Exception as e:
+                errored = True
+                results[op["name"]] = e
+                raise
+
+        results[op["name"]] = result
+        return result
+
+    for op in ops:
+        tasks[op["name"]] = asyncio.create_task(run(op))
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    return results
+
+
 def run_test_suite(args: argparse.Namespace) -> bool:
     """Run the test suite with specified configuration."""
+    from mcp.tools.integrated import AdvancedDeveloperTools, MemoryTool
+
+    # Unlike the other scripts, tools are not taken from the pool daemon:
+    # linting and tests run concurrently on one AdvancedDeveloperTools, which
+    # the daemon would serialize, and results are stored with batch_store,
+    # which the daemon doesn't expose
     workspace = Path.cwd()
     memory_tool = MemoryTool()
     adv_tool = AdvancedDeveloperTools(
@@ -57,19 +121,22 @@ def run_test_suite(args: argparse.Namespace) -> bool:
         memory_tool=memory_tool
     )
 
-    timestamp = datetime.utcnow().isoformat()
-    success = True
+    timestamp = iso_from_ns(time.time_ns())
+    ops = []
 
     try:
         # Run linting if requested
         if args.lint:
             print("Running linting checks...")
-            result = adv_tool(
-                operation="lint",
-                lint_type="all",
-                store_results=True
-            )
-            success = success and result.success
+            ops.append({
+                "name": "lint",
+                "tool": adv_tool,
+                "kwargs": {
+                    "operation": "lint",
+                    "lint_type": "all",
+                    "store_results": False
+                }
+            })
 
         # Determine test arguments
         test_args = []
@@ -87,35 +154,62 @@ def run_test_suite(args: argparse.Namespace) -> bool:
         # Run tests
         if args.container:
             print("Running tests in container...")
-            result = adv_tool(
-                operation="container",
-                container_op="test",
-                extra_args=test_args
-            )
+            test_kwargs = {
+                "operation": "container",
+                "container_op": "test",
+                "extra_args": test_args
+            }
         else:
             print("Running tests...")
-            result = adv_tool(
-                operation="test",
-                test_type="coverage" if args.coverage else "pytest",
-                extra_args=test_args,
-                store_results=True
-            )
-
-        success = success and result.success
-
-        # Store test results
-        memory_tool(
-            operation="store",
-            key=f"test_run_{timestamp}",
-            data={
-                "args": vars(args),
-                "result": result.data,
-                "success": success
-            },
-            tags=["test_run", timestamp[:10]]
-        )
-
-        return success
+            test_kwargs = {
+                "operation": "test",
+                "test_type": "coverage" if args.coverage else "pytest",
+                "extra_args": test_args,
+                "store_results": False
+            }
+        ops.append({"name": "test", "tool": adv_tool, "kwargs": test_kwargs})
+
+        # Store lint, test and run results together once linting and tests finish
+        def store_kwargs(results: Dict[str, Any]) -> Dict[str, Any]:
+            date = timestamp[:10]
+            entries = []
+            if "lint" in results and results["lint"].data:
+                entries.append((
+                    f"lint_results_all_{timestamp}",
+                    results["lint"].data,
+                    ["lint", "all", date]
+                ))
+            if test_kwargs["operation"] == "test" and results["test"].data:
+                test_type = test_kwargs["test_type"]
+                entries.append((
+                    f"test_results_{test_type}_{timestamp}",
+                    results["test"].data,
+                    ["test", test_type, date]
+                ))
+            entries.append((
+                f"test_run_{timestamp}",
+                {
+                    "args": vars(args),
+                    "result": results["test"].data,
+                    "success": all(r.success for r in results.values())
+                },
+                ["test_run", date]
+            ))
+            return {"entries": entries}
+
+        ops.append({
+            "name": "store",
+            "tool": memory_tool.batch_store,
+            "depends_on": [op["name"] for op in ops],
+            "kwargs": store_kwargs
+        })
+
+        results = asyncio.run(batch_execute(ops))
+        for outcome in results.values():
+            if isinstance(outcome, Exception):
+                raise outcome
+
+        return all(results[name].success for name in ("lint", "test") if name in results)
 
     except Exception as e:
         print(f"Error running tests: {e}", file=sys.stderr)
@@ -124,7 +218,7 @@ def run_test_suite(args: argparse.Namespace) -> bool:
 
 def main() -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parsed_args(parse_args)
     success = run_test_suite(args)
     return 0 if success else 1
 
@@ -4,12 +4,18 @@ Script for managing MCP servers and tools.
 """
 
 import argparse
-import json
+import contextlib
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import orjson
 import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mcp.tools.integrated import (
     DeveloperTool,
@@ -18,8 +24,43 @@ from mcp.tools.integrated import (
     VisualizationTool
 )
 
+# Maximum concurrent requests sent to a single server
+MAX_REQUESTS_PER_HOST = 8
+
+# Maximum concurrent health probes when adding servers in bulk
+MAX_HEALTH_PROBES = 32
+
+# (connect, read) timeouts in seconds for server health probes
+HEALTH_TIMEOUT = (2.0, 3.0)
+
+# Seconds a health probe result is reused for the same URL
+HEALTH_CACHE_TTL = 5.0
+
+# Consecutive server failures that open a server's circuit breaker, and the
+# seconds it then stays open, failing calls without network I/O
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30.0
+
+# Only idempotent requests are retried; tool execution is a POST and must not
+# run twice because a gateway timed out
+RETRY_METHODS = frozenset(["GET", "HEAD", "DELETE"])
+
+# Tools that can be enabled on a server, by name
+VALID_TOOLS = {
+    "dev": DeveloperTool,
+    "advanced-dev": AdvancedDeveloperTools,
+    "memory": MemoryTool,
+    "visualization": VisualizationTool
+}
+
+# Raw config file contents keyed by path, valid while (mtime_ns, size) match
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, bytes]] = {}
+
 class ToolExecutionRequest(BaseModel):
-    """Model for tool execution requests."""
+    """Model for tool execution requests.
+
+    Documents the request body sent by MCPServerManager.execute_tool.
+    """
     tool_name: str
     parameters: Dict[str, Any]
     context: Optional[Dict[str, Any]] = None
@@ -27,25 +68,174 @@ class ToolExecutionRequest(BaseModel):
 class MCPServerManager:
     """Manager for MCP servers and tools."""
 
-    def __init__(self, config_path: Path = None):
+    def __init__(self, config_path: Path = None, health_cache: bool = True):
         """Initialize the server manager.
 
         Args:
             config_path: Path to config file. Defaults to ~/.mcp/servers.json
+            health_cache: Reuse health probe results for HEALTH_CACHE_TTL seconds
         """
         self.config_path = config_path or Path.home() / '.mcp' / 'servers.json'
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         self.servers = self._load_config()
+        self._health_cache: Optional[Dict[str, Tuple[float, Optional[str]]]] = (
+            {} if health_cache else None
+        )
+        # Server URL -> (consecutive failures, monotonic time the breaker closes)
+        self._breaker: Dict[str, Tuple[int, float]] = {}
+        self._batch_depth = 0
+        self._dirty = False
+
+        # Reuse keep-alive connections across calls to the same server
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=RETRY_METHODS
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def __enter__(self) -> "MCPServerManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load server configuration."""
-        if self.config_path.exists():
-            return json.loads(self.config_path.read_text())
-        return {"servers": {}}
+        """Load server configuration.
+
+        The file is only re-read when its mtime or size changed since the last
+        load in this process. Cached bytes are decoded on every call so each
+        manager gets its own copy, which orjson does faster than deepcopy.
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return {"servers": {}}
+
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+            cached = (st.st_mtime_ns, st.st_size, self.config_path.read_bytes())
+            _CONFIG_CACHE[self.config_path] = cached
+        return orjson.loads(cached[2])
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["MCPServerManager"]:
+        """Group several mutations into a single config write.
+
+        Saves requested inside the block are deferred and written once when the
+        outermost batch exits, including when it exits with an exception, so
+        changes already made are not lost.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_config()
 
     def _save_config(self):
-        """Save server configuration."""
-        self.config_path.write_text(json.dumps(self.servers, indent=2))
+        """Save server configuration.
+
+        The file is replaced atomically so a crash mid-write cannot leave a
+        truncated config behind.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+
+        data = orjson.dumps(
+            self.servers,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+        tmp_path = self.config_path.with_name(
+            f".{self.config_path.name}.{os.getpid()}.tmp"
+        )
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
+        self._dirty = False
+        st = self.config_path.stat()
+        _CONFIG_CACHE[self.config_path] = (st.st_mtime_ns, st.st_size, data)
+
+    def _concurrent_requests(
+        self,
+        send: Callable[[Any], Any],
+        items: List[Any],
+        max_workers: int = MAX_REQUESTS_PER_HOST
+    ) -> List[Any]:
+        """Send one request per item concurrently, returning results in order."""
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(send, items))
+
+    @contextlib.contextmanager
+    def _breaker_guard(self, url: str) -> Iterator[None]:
+        """Guard requests to a server with its circuit breaker.
+
+        Raises immediately while the breaker is open. Connection errors and 5xx
+        responses raised inside the block count as failures; anything else
+        resets the server's failure count.
+
+        Args:
+            url: Server URL
+        """
+        failures, open_until = self._breaker.get(url, (0, 0.0))
+        if open_until > time.monotonic():
+            raise requests.exceptions.ConnectionError(
+                f"Circuit open for {url} after {failures} consecutive failures"
+            )
+
+        try:
+            yield
+        except requests.exceptions.RequestException as e:
+            response = getattr(e, "response", None)
+            if response is None or response.status_code >= 500:
+                failures = self._breaker.get(url, (0, 0.0))[0] + 1
+                open_until = (
+                    time.monotonic() + BREAKER_COOLDOWN
+                    if failures >= BREAKER_THRESHOLD else 0.0
+                )
+                self._breaker[url] = (failures, open_until)
+            else:
+                self._breaker.pop(url, None)
+            raise
+        self._breaker.pop(url, None)
+
+    def _check_health(self, url: str) -> Optional[str]:
+        """Probe a server's health endpoint.
+
+        Args:
+            url: Server URL
+
+        Returns:
+            None if the server is healthy, else a description of the failure
+        """
+        if self._health_cache is not None:
+            cached = self._health_cache.get(url)
+            if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+                return cached[1]
+
+        try:
+            with self._breaker_guard(url):
+                response = self._session.get(f"{url}/health", timeout=HEALTH_TIMEOUT)
+                response.raise_for_status()
+            error = None
+        except Exception as e:
+            error = str(e)
+
+        if self._health_cache is not None:
+            self._health_cache[url] = (time.monotonic(), error)
+        return error
 
     def add_server(
         self,
@@ -67,11 +257,9 @@ class MCPServerManager:
             return False
 
         # Validate server URL
-        try:
-            response = requests.get(f"{url}/health")
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Error connecting to server: {e}", file=sys.stderr)
+        error = self._check_health(url)
+        if error:
+            print(f"Error connecting to server: {error}", file=sys.stderr)
             return False
 
         # Add server configuration
@@ -84,6 +272,54 @@ class MCPServerManager:
         self._save_config()
         return True
 
+    def bulk_add_servers(self, entries: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Add several MCP servers, probing their health concurrently.
+
+        Args:
+            entries: Server definitions with 'name' and 'url' keys and
+                optional 'tools' and 'description' keys
+
+        Returns:
+            Mapping of server name to whether it was added
+        """
+        results = {}
+        pending = []
+        for entry in entries:
+            name = entry["name"]
+            if name in self.servers["servers"] or name in results:
+                print(f"Server '{name}' already exists", file=sys.stderr)
+                results.setdefault(name, False)
+                continue
+            results[name] = False
+            pending.append(entry)
+
+        if not pending:
+            return results
+
+        errors = self._concurrent_requests(
+            lambda entry: self._check_health(entry["url"]),
+            pending,
+            max_workers=MAX_HEALTH_PROBES
+        )
+        for entry, error in zip(pending, errors):
+            if error:
+                print(
+                    f"Error connecting to server '{entry['name']}': {error}",
+                    file=sys.stderr
+                )
+                continue
+            self.servers["servers"][entry["name"]] = {
+                "url": entry["url"],
+                "tools": entry.get("tools") or [],
+                "description": entry.get("description") or "",
+                "status": "active"
+            }
+            results[entry["name"]] = True
+
+        if any(results.values()):
+            self._save_config()
+        return results
+
     def remove_server(self, name: str) -> bool:
         """Remove an MCP server.
 
@@ -120,31 +356,44 @@ class MCPServerManager:
         url = server["url"]
 
         # Validate tools
-        valid_tools = {
-            "dev": DeveloperTool,
-            "advanced-dev": AdvancedDeveloperTools,
-            "memory": MemoryTool,
-            "visualization": VisualizationTool
-        }
-
-        invalid_tools = set(tools) - set(valid_tools.keys())
+        invalid_tools = [tool for tool in dict.fromkeys(tools) if tool not in VALID_TOOLS]
         if invalid_tools:
             print(f"Invalid tools: {', '.join(invalid_tools)}", file=sys.stderr)
             return False
 
         # Add tools to server
+        errors = []
         try:
-            for tool in tools:
-                if tool not in server["tools"]:
-                    # Register tool with server
-                    response = requests.post(
-                        f"{url}/tools",
-                        json={"tool": tool}
+            new_tools = [t for t in dict.fromkeys(tools) if t not in server["tools"]]
+            if new_tools:
+                with self._breaker_guard(url):
+                    # Register all tools with the server in one request
+                    response = self._session.post(
+                        f"{url}/tools/bulk",
+                        json={"tools": new_tools}
                     )
-                    response.raise_for_status()
-                    server["tools"].append(tool)
-
+                    if response.status_code == 404:
+                        # Server has no bulk endpoint; register tools concurrently
+                        for tool, response in zip(new_tools, self._concurrent_requests(
+                            lambda tool: self._session.post(f"{url}/tools", json={"tool": tool}),
+                            new_tools
+                        )):
+                            if 200 <= response.status_code < 300:
+                                server["tools"].append(tool)
+                            else:
+                                errors.append(
+                                    f"{tool} ({response.status_code}: {response.text[:200]})"
+                                )
+                    else:
+                        response.raise_for_status()
+                        result = response.json()
+                        server["tools"].extend(result["added"] + result["skipped"])
+
+            # Save tools that were registered even if others failed
             self._save_config()
+            if errors:
+                print(f"Error adding tools: {'; '.join(errors)}", file=sys.stderr)
+                return False
             return True
 
         except Exception as e:
@@ -165,17 +414,39 @@ class MCPServerManager:
         server = self.servers["servers"][name]
         url = server["url"]
 
+        errors = []
         try:
-            for tool in tools:
-                if tool in server["tools"]:
-                    # Unregister tool from server
-                    response = requests.delete(
-                        f"{url}/tools/{tool}"
+            old_tools = [t for t in dict.fromkeys(tools) if t in server["tools"]]
+            if old_tools:
+                with self._breaker_guard(url):
+                    # Unregister all tools from the server in one request
+                    response = self._session.delete(
+                        f"{url}/tools/bulk",
+                        json={"tools": old_tools}
                     )
-                    response.raise_for_status()
-                    server["tools"].remove(tool)
-
+                    if response.status_code == 404:
+                        # Server has no bulk endpoint; unregister tools concurrently
+                        for tool, response in zip(old_tools, self._concurrent_requests(
+                            lambda tool: self._session.delete(f"{url}/tools/{tool}"),
+                            old_tools
+                        )):
+                            if 200 <= response.status_code < 300:
+                                server["tools"].remove(tool)
+                            else:
+                                errors.append(
+                                    f"{tool} ({response.status_code}: {response.text[:200]})"
+                                )
+                    else:
+                        response.raise_for_status()
+                        result = response.json()
+                        for tool in result["removed"] + result["skipped"]:
+                            server["tools"].remove(tool)
+
+            # Save tools that were unregistered even if others failed
             self._save_config()
+            if errors:
+                print(f"Error removing tools: {'; '.join(errors)}", file=sys.stderr)
+                return False
             return True
 
         except Exception as e:
@@ -200,22 +471,46 @@ class MCPServerManager:
         Returns:
             Tool execution results
         """
+        return orjson.loads(
+            self.execute_tool_raw(server_name, tool_name, parameters, context)
+        )
+
+    def execute_tool_raw(
+        self,
+        server_name: str,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Execute a tool on a specific server without decoding the response.
+
+        Args:
+            server_name: Name of the server to execute the tool on
+            tool_name: Name of the tool to execute
+            parameters: Tool parameters
+            context: Optional execution context
+
+        Returns:
+            Tool execution results as the JSON bytes sent by the server
+        """
         if server_name not in self.servers["servers"]:
             raise ValueError(f"Server '{server_name}' not found")
 
         server = self.servers["servers"][server_name]
         url = f"{server['url']}/tools/{tool_name}/execute"
 
-        request_data = ToolExecutionRequest(
-            tool_name=tool_name,
-            parameters=parameters,
-            context=context
-        )
+        # Shaped like ToolExecutionRequest; the server validates it on receipt
+        request_data = {
+            "tool_name": tool_name,
+            "parameters": parameters,
+            "context": context
+        }
 
         try:
-            response = requests.post(url, json=request_data.dict())
-            response.raise_for_status()
-            return response.json()
+            with self._breaker_guard(server["url"]):
+                response = self._session.post(url, json=request_data)
+                response.raise_for_status()
+            return response.content
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to execute tool: {str(e)}")
 
@@ -229,6 +524,18 @@ class MCPServerManager:
         Returns:
             Tool information
         """
+        return orjson.loads(self.get_tool_info_raw(server_name, tool_name))
+
+    def get_tool_info_raw(self, server_name: str, tool_name: str) -> bytes:
+        """Get information about a specific tool without decoding the response.
+
+        Args:
+            server_name: Name of the server
+            tool_name: Name of the tool
+
+        Returns:
+            Tool information as the JSON bytes sent by the server
+        """
         if server_name not in self.servers["servers"]:
             raise ValueError(f"Server '{server_name}' not found")
 
@@ -236,9 +543,10 @@ class MCPServerManager:
         url = f"{server['url']}/tools/{tool_name}/info"
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
+            with self._breaker_guard(server["url"]):
+                response = self._session.get(url)
+                response.raise_for_status()
+            return response.content
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to get tool info: {str(e)}")
 
@@ -308,11 +616,21 @@ def parse_args() -> argparse.Namespace:
         "--context",
         help="Execution context"
     )
+    execute_parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Write the server's JSON response as-is instead of pretty-printing it"
+    )
 
     # Info command
     info_parser = subparsers.add_parser("info", help="Get tool information")
     info_parser.add_argument("server", help="Server name")
     info_parser.add_argument("tool", help="Tool name")
+    info_parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Write the server's JSON response as-is instead of pretty-printing it"
+    )
 
     # Common options
     parser.add_argument(
@@ -320,6 +638,11 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Path to config file"
     )
+    parser.add_argument(
+        "--no-health-cache",
+        action="store_true",
+        help="Probe server health on every check instead of reusing recent results"
+    )
 
     return parser.parse_args()
 
@@ -335,79 +658,110 @@ def format_server(server: Dict[str, Any]) -> str:
     )
 
 
+def write_json(raw: bytes, passthrough: bool):
+    """Write a JSON response to stdout, pretty-printed unless passed through."""
+    if not passthrough:
+        raw = orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2)
+    sys.stdout.buffer.write(raw + b"\n")
+
+
+def _handle_add(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    if manager.add_server(
+        args.name,
+        args.url,
+        args.tools,
+        args.description
+    ):
+        print(f"Successfully added server '{args.name}'")
+        return 0
+    return 1
+
+
+def _handle_remove(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    if manager.remove_server(args.name):
+        print(f"Successfully removed server '{args.name}'")
+        return 0
+    return 1
+
+
+def _handle_list(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    servers = manager.list_servers()
+    if args.format == "json":
+        print(orjson.dumps(servers, option=orjson.OPT_INDENT_2).decode())
+    else:
+        if not servers:
+            print("No servers configured")
+        else:
+            for server in servers:
+                print("-" * 40)
+                print(format_server(server))
+    return 0
+
+
+def _handle_tools_add(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    if manager.add_tools(args.name, args.tools):
+        print(f"Successfully added tools to server '{args.name}'")
+        return 0
+    return 1
+
+
+def _handle_tools_remove(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    if manager.remove_tools(args.name, args.tools):
+        print(f"Successfully removed tools from server '{args.name}'")
+        return 0
+    return 1
+
+
+def _handle_execute(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    # Parse parameters from command line
+    params = {}
+    if args.parameters:
+        for param in args.parameters:
+            key, value = param.split("=", 1)
+            params[key] = value
+
+    raw = manager.execute_tool_raw(
+        args.server,
+        args.tool,
+        parameters=params,
+        context=orjson.loads(args.context) if args.context else None
+    )
+    write_json(raw, args.raw)
+    return 0
+
+
+def _handle_info(args: argparse.Namespace, manager: MCPServerManager) -> int:
+    write_json(manager.get_tool_info_raw(args.server, args.tool), args.raw)
+    return 0
+
+
+HANDLERS = {
+    "add": _handle_add,
+    "remove": _handle_remove,
+    "list": _handle_list,
+    "tools-add": _handle_tools_add,
+    "tools-remove": _handle_tools_remove,
+    "execute": _handle_execute,
+    "info": _handle_info,
+}
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
-    manager = MCPServerManager(config_path=args.config)
 
-    try:
-        if args.command == "add":
-            if manager.add_server(
-                args.name,
-                args.url,
-                args.tools,
-                args.description
-            ):
-                print(f"Successfully added server '{args.name}'")
-                return 0
-            return 1
-
-        elif args.command == "remove":
-            if manager.remove_server(args.name):
-                print(f"Successfully removed server '{args.name}'")
-                return 0
-            return 1
-
-        elif args.command == "list":
-            servers = manager.list_servers()
-            if args.format == "json":
-                print(json.dumps(servers, indent=2))
-            else:
-                if not servers:
-                    print("No servers configured")
-                else:
-                    for server in servers:
-                        print("-" * 40)
-                        print(format_server(server))
-            return 0
-
-        elif args.command == "tools-add":
-            if manager.add_tools(args.name, args.tools):
-                print(f"Successfully added tools to server '{args.name}'")
-                return 0
-            return 1
-
-        elif args.command == "tools-remove":
-            if manager.remove_tools(args.name, args.tools):
-                print(f"Successfully removed tools from server '{args.name}'")
-                return 0
-            return 1
-
-        elif args.command == "execute":
-            # Parse parameters from command line
-            params = {}
-            if args.parameters:
-                for param in args.parameters:
-                    key, value = param.split("=", 1)
-                    params[key] = value
-
-            result = manager.execute_tool(
-                args.server,
-                args.tool,
-                parameters=params,
-                context=json.loads(args.context) if args.context else None
-            )
-            print(json.dumps(result, indent=2))
-            return 0
+    handler = HANDLERS.get(args.command)
+    if handler is None:
+        print("No command specified", file=sys.stderr)
+        return 1
 
-        elif args.command == "info":
-            info = manager.get_tool_info(args.server, args.tool)
-            print(json.dumps(info, indent=2))
-            return 0
+    manager = MCPServerManager(
+        config_path=args.config,
+        health_cache=not args.no_health_cache
+    )
 
-        else:
-            print("No command specified", file=sys.stderr)
-            return 1
+    try:
+        return handler(args, manager)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
@@ -415,7 +769,9 @@ def main() -> int:
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         return 1
+    finally:
+        manager.close()
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
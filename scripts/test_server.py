@@ -4,7 +4,7 @@ Test server for MCP tools integration testing.
 """
 
 from fastapi import FastAPI, HTTPException, Request
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import uvicorn
 import json
 from pathlib import Path
@@ -13,8 +13,12 @@ from pydantic import BaseModel
 class ToolRequest(BaseModel):
     """Model for tool execution requests."""
     tool_name: str
-    parameters: Dict[str, any]
-    context: Optional[Dict[str, any]] = None
+    parameters: Dict[str, Any]
+    context: Optional[Dict[str, Any]] = None
+
+class BulkToolRequest(BaseModel):
+    """Model for bulk tool registration requests."""
+    tools: List[str]
 
 app = FastAPI(title="MCP Test Server")
 
@@ -32,6 +36,11 @@ AVAILABLE_TOOLS = {
     }
 }
 
+# Required parameter names per tool, built once for request validation
+REQUIRED_PARAMETERS = {
+    name: frozenset(tool["parameters"]) for name, tool in AVAILABLE_TOOLS.items()
+}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -42,6 +51,25 @@ async def list_tools():
     """List available tools with their descriptions and parameters."""
     return {"tools": AVAILABLE_TOOLS}
 
+# Tools registered by clients
+ENABLED_TOOLS = set()
+
+@app.post("/tools/bulk")
+async def add_tools_bulk(request: BulkToolRequest):
+    """Register several tools in one request."""
+    added = [tool for tool in request.tools if tool not in ENABLED_TOOLS]
+    skipped = [tool for tool in request.tools if tool in ENABLED_TOOLS]
+    ENABLED_TOOLS.update(added)
+    return {"added": added, "skipped": skipped}
+
+@app.delete("/tools/bulk")
+async def remove_tools_bulk(request: BulkToolRequest):
+    """Unregister several tools in one request."""
+    removed = [tool for tool in request.tools if tool in ENABLED_TOOLS]
+    skipped = [tool for tool in request.tools if tool not in ENABLED_TOOLS]
+    ENABLED_TOOLS.difference_update(removed)
+    return {"removed": removed, "skipped": skipped}
+
 @app.get("/status")
 async def server_status():
     """Get server status."""
@@ -59,11 +87,8 @@ async def execute_tool(tool_name: str, request: ToolRequest):
         raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
 
     # Validate parameters
-    required_params = set(AVAILABLE_TOOLS[tool_name]["parameters"])
-    provided_params = set(request.parameters.keys())
-
-    if not required_params.issubset(provided_params):
-        missing = required_params - provided_params
+    missing = REQUIRED_PARAMETERS[tool_name] - request.parameters.keys()
+    if missing:
         raise HTTPException(
             status_code=400,
             detail=f"Missing required parameters: {', '.join(missing)}"
@@ -90,7 +115,17 @@ async def tool_info(tool_name: str):
 
 def main():
     """Run the test server."""
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # A single worker keeps ENABLED_TOOLS consistent across requests
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        # uvicorn picks uvloop and httptools whenever they are installed
+        loop="auto",
+        http="auto",
+        access_log=False,
+        backlog=2048
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
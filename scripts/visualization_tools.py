@@ -4,10 +4,11 @@ Script for visualization operations using VisualizationTool.
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
+
+import orjson
 
 from mcp.tools.integrated import VisualizationTool
 
@@ -76,15 +77,68 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Output directory"
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and run newline-delimited JSON commands from stdin"
+    )
 
     return parser.parse_args()
 
 
 def read_data(data_arg: str) -> Any:
     """Read data from argument or stdin."""
-    if data_arg == "-":
-        return json.load(sys.stdin)
-    return json.loads(data_arg)
+    buf = sys.stdin.buffer.read() if data_arg == "-" else data_arg.encode()
+    return orjson.loads(buf)
+
+
+def tool_kwargs(command: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Build VisualizationTool arguments for a command and its options."""
+    if command == "dashboard":
+        return {
+            "operation": "dashboard",
+            "data": options["data"],
+            "title": options.get("title") or "MCP Dashboard",
+            "description": options.get("description") or ""
+        }
+    if command == "pattern":
+        return {
+            "operation": "pattern",
+            "data": options["data"],
+            "pattern_type": options["type"],
+            "title": options.get("title") or "",
+            "description": options.get("description") or ""
+        }
+    if command == "save":
+        return {
+            "operation": "save",
+            "data": options["data"],
+            "output_format": options.get("format") or "html",
+            "title": options.get("title") or ""
+        }
+    raise ValueError(f"Unknown command: {command}")
+
+
+def run_daemon(viz_tool: Any) -> int:
+    """Run commands read as JSON lines from stdin, one JSON result line each.
+
+    Each line is an object with a ``command`` and that command's options, e.g.
+    ``{"command": "save", "data": {...}, "format": "png"}``. The tool is
+    initialized once and reused for every command.
+    """
+    out = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            options = orjson.loads(line)
+            result = viz_tool(**tool_kwargs(options["command"], options))
+            reply = {"success": result.success, "data": result.data, "error": result.error}
+        except Exception as e:
+            reply = {"success": False, "data": None, "error": str(e)}
+        out.write(orjson.dumps(reply, default=str) + b"\n")
+        out.flush()
+    return 0
 
 
 def main() -> int:
@@ -96,22 +150,27 @@ def main() -> int:
         output_dir=args.output_dir
     ) if args.output_dir else VisualizationTool()
 
+    if args.daemon:
+        try:
+            return run_daemon(viz_tool)
+        except KeyboardInterrupt:
+            return 130
+
+    if args.command not in ("dashboard", "pattern", "save"):
+        print("No command specified", file=sys.stderr)
+        return 1
+
     try:
         # Read data
         try:
             data = read_data(args.data)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing JSON data: {e}", file=sys.stderr)
             return 1
 
-        if args.command == "dashboard":
-            result = viz_tool(
-                operation="dashboard",
-                data=data,
-                title=args.title,
-                description=args.description or ""
-            )
+        result = viz_tool(**tool_kwargs(args.command, {**vars(args), "data": data}))
 
+        if args.command == "dashboard":
             if result.success:
                 print("Dashboard started successfully")
                 print(f"Data file: {result.data['data_file']}")
@@ -121,33 +180,21 @@ def main() -> int:
                 return 1
 
         elif args.command == "pattern":
-            result = viz_tool(
-                operation="pattern",
-                data=data,
-                pattern_type=args.type,
-                title=args.title or "",
-                description=args.description or ""
-            )
-
             if result.success:
                 print("Pattern visualization generated successfully")
                 print(f"Output file: {result.data['output_file']}")
                 if "visualization" in result.data:
                     print("\nVisualization data:")
-                    print(json.dumps(result.data["visualization"], indent=2))
+                    print(orjson.dumps(
+                        result.data["visualization"],
+                        option=orjson.OPT_INDENT_2
+                    ).decode())
                 return 0
             else:
                 print(f"Error: {result.error}", file=sys.stderr)
                 return 1
 
-        elif args.command == "save":
-            result = viz_tool(
-                operation="save",
-                data=data,
-                output_format=args.format,
-                title=args.title or ""
-            )
-
+        else:
             if result.success:
                 print("Visualization saved successfully")
                 print(f"Format: {result.data['format']}")
@@ -157,10 +204,6 @@ def main() -> int:
                 print(f"Error: {result.error}", file=sys.stderr)
                 return 1
 
-        else:
-            print("No command specified", file=sys.stderr)
-            return 1
-
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         return 130
@@ -2,14 +2,15 @@
 FastAPI server with enhanced monitoring and visualization capabilities.
 """
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from fastapi import FastAPI, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import uvicorn
@@ -25,7 +26,7 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-app = FastAPI(title="Enhanced MCP Server")
+app = FastAPI(title="Enhanced MCP Server", default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -36,6 +37,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as /metrics dashboards and command results
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
@@ -69,23 +73,35 @@ class CodeAnalysisRequest(BaseModel):
     """Model for code analysis requests."""
     code: str
     analysis_type: Optional[str] = "all"
+    patterns: Optional[List[str]] = None
 
 class CommandRequest(BaseModel):
     """Model for general command requests."""
     type: str
     prompt: Optional[str] = None
     analysis_type: Optional[str] = None
+    patterns: Optional[List[str]] = None
     data: Optional[Dict[str, Any]] = None
 
-# User database (replace with actual database in production)
+# User database (replace with actual database in production). The admin
+# password hash is filled in at startup, see init_admin_password.
 fake_users_db = {
     "admin": {
         "username": "admin",
-        "hashed_password": pwd_context.hash(os.getenv("ADMIN_PASSWORD", "admin")),
+        "hashed_password": None,
         "disabled": False,
     }
 }
 
+@app.on_event("startup")
+async def init_admin_password():
+    """Set the admin password hash, hashing ADMIN_PASSWORD only if no
+    precomputed ADMIN_PASSWORD_HASH is provided."""
+    fake_users_db["admin"]["hashed_password"] = (
+        os.getenv("ADMIN_PASSWORD_HASH")
+        or pwd_context.hash(os.getenv("ADMIN_PASSWORD", "admin"))
+    )
+
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -132,6 +148,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
     return user
 
+@app.on_event("shutdown")
+async def close_mcp_tools():
+    """Close pooled provider connections."""
+    await mcp_tools.aclose()
+
 @app.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     user = authenticate_user(fake_users_db, form_data.username, form_data.password)
@@ -156,9 +177,9 @@ async def generate_code(
     try:
         result = await mcp_tools.process_command({
             "type": "code_generation",
-            **request.dict()
+            **request.model_dump()
         })
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -171,9 +192,9 @@ async def analyze_code(
     try:
         result = await mcp_tools.process_command({
             "type": "code_analysis",
-            **request.dict()
+            **request.model_dump()
         })
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -184,17 +205,17 @@ async def handle_command(
 ):
     """Handle general MCP commands with monitoring."""
     try:
-        result = await mcp_tools.process_command(request.dict())
-        return JSONResponse(content=result)
+        result = await mcp_tools.process_command(request.model_dump())
+        return ORJSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/metrics")
+@app.get("/metrics", response_class=ORJSONResponse)
 async def get_metrics(current_user: User = Depends(get_current_user)):
     """Get performance metrics and visualizations."""
     try:
         metrics = mcp_tools.get_performance_metrics()
-        return JSONResponse(content=metrics)
+        return ORJSONResponse(content=metrics)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,12 +1,18 @@
 """
 Enhanced MCP Tools with multi-provider support and code analysis capabilities.
 """
+import atexit
+import copy
+import functools
+import hashlib
 import os
+import queue
+import threading
 import time
-import json
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, Iterable, List, Optional, Literal, Tuple
 from datetime import datetime
 import asyncio
+from collections import OrderedDict, deque
 import logging
 from pathlib import Path
 import ast
@@ -14,10 +20,13 @@ import re
 
 import anthropic
 from anthropic.types import Message
+import httpx
 import openai
+import orjson
 from openai import AsyncOpenAI
 import plotly.graph_objects as go
 import pandas as pd
+from pandas.api.types import union_categoricals
 import networkx as nx
 
 # Configure logging
@@ -26,14 +35,205 @@ logger = logging.getLogger(__name__)
 
 ProviderType = Literal["anthropic", "openai", "auto"]
 
+# When set, "auto" requests with no clear provider preference are sent to both
+# providers and the first successful answer wins. Off by default since every
+# raced request is paid for twice.
+RACE_PROVIDERS = os.getenv("MCP_RACE_PROVIDERS", "").lower() in ("1", "true", "yes")
+
+def _count_import(node: ast.Import, metrics: Dict[str, Any]):
+    for name in node.names:
+        metrics["imports"].append(name.name)
+
+def _count_import_from(node: ast.ImportFrom, metrics: Dict[str, Any]):
+    module = node.module or ""
+    for name in node.names:
+        metrics["imports"].append(f"{module}.{name.name}")
+
+def _count_function(node: ast.FunctionDef, metrics: Dict[str, Any]):
+    metrics["num_functions"] += 1
+    metrics["function_names"].append(node.name)
+
+def _count_class(node: ast.ClassDef, metrics: Dict[str, Any]):
+    metrics["num_classes"] += 1
+    metrics["class_names"].append(node.name)
+
+# Per-node-type metric collectors for analyze_complexity
+_COMPLEXITY_HANDLERS = {
+    ast.Import: _count_import,
+    ast.ImportFrom: _count_import_from,
+    ast.FunctionDef: _count_function,
+    ast.ClassDef: _count_class,
+}
+
+# Upper bound on AST nodes visited per analysis; larger inputs are truncated
+MAX_COMPLEXITY_NODES = 500_000
+
+def _collect_complexity(
+    tree: ast.AST,
+    metrics: Dict[str, Any],
+    max_nodes: int = MAX_COMPLEXITY_NODES,
+    _get_handler=_COMPLEXITY_HANDLERS.get,
+    _AST=ast.AST,
+    _expr=ast.expr,
+    _FunctionDef=ast.FunctionDef
+) -> int:
+    """Collect metrics from an AST in one breadth-first pass, returning the
+    complexity score.
+
+    Nodes are visited in ast.walk order. Each node carries how many
+    FunctionDefs enclose it (itself included); summing that over all nodes
+    gives the total size of every function's subtree without re-walking nested
+    functions. Globals are bound as defaults so lookups in the loop are local.
+
+    At most max_nodes nodes are visited; past that the walk stops and
+    metrics["truncated"] is set, bounding time on pathological inputs.
+    """
+    score = 0
+    queue = deque([(tree, 0)])
+    popleft = queue.popleft
+    push = queue.append
+    while queue:
+        if max_nodes <= 0:
+            metrics["truncated"] = True
+            break
+        max_nodes -= 1
+        node, depth = popleft()
+        handler = _get_handler(type(node))
+        if handler is not None:
+            handler(node, metrics)
+            if type(node) is _FunctionDef:
+                depth += 1
+        score += depth
+
+        # Outside functions only statements matter, and expressions never
+        # contain statements, so their subtrees are skipped
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, _AST) and (depth or not isinstance(item, _expr)):
+                        push((item, depth))
+            elif isinstance(value, _AST) and (depth or not isinstance(value, _expr)):
+                push((value, depth))
+    return score
+
+def _memoize_by_digest(maxsize: int, copy_result: bool = True):
+    """LRU-cache a function of a source string, keyed on a digest of it.
+
+    Keying on a 16-byte digest keeps the cache small however large the
+    submitted code is. Any further arguments must be hashable and are part of
+    the key. Callers get a copy of the cached result unless copy_result is
+    False, in which case they must treat it as read-only.
+    """
+    def decorator(func):
+        cache: "OrderedDict[Tuple[bytes, tuple], Any]" = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(code: str, *args):
+            key = (
+                hashlib.blake2b(
+                    code.encode("utf-8", "surrogatepass"),
+                    digest_size=16
+                ).digest(),
+                args
+            )
+            with lock:
+                result = cache.get(key)
+                if result is not None:
+                    cache.move_to_end(key)
+            if result is None:
+                result = func(code, *args)
+                with lock:
+                    cache[key] = result
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return copy.deepcopy(result) if copy_result else result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@_memoize_by_digest(16, copy_result=False)
+def _parse_tree(code: str) -> ast.AST:
+    """Parse source once for every analysis of it. The tree is shared, so
+    callers must not modify it."""
+    return ast.parse(code)
+
+# Patterns counted by CodeAnalyzer.analyze_patterns. Parseable code is counted
+# structurally from its tree; these regexes are the fallback for code that
+# does not parse, and always count todo_comments since comments are not
+# part of the tree.
+_PATTERNS = {
+    "error_handling": re.compile(r'try|except|finally'),
+    "async_code": re.compile(r'async|await'),
+    "type_hints": re.compile(r':\s*[A-Za-z\[\]]+'),
+    "docstrings": re.compile(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''),
+    "todo_comments": re.compile(r'#\s*TODO'),
+    "magic_numbers": re.compile(r'\b\d+\b(?!\s*[=:]\s*[\'"]\w+)'),
+}
+
+# Code longer than this leaves out magic_numbers unless it is requested
+MAGIC_NUMBERS_SIZE_LIMIT = 200_000
+
+_TRY_NODES = (ast.Try, getattr(ast, "TryStar", ast.Try))
+_ASYNC_NODES = (ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith, ast.Await)
+_DOCSTRING_NODES = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+def _count_tree_patterns(tree: ast.AST) -> Dict[str, int]:
+    """Count the structural patterns in a parse tree in one walk."""
+    counts = dict.fromkeys(_PATTERNS, 0)
+    for node in ast.walk(tree):
+        if isinstance(node, _TRY_NODES):
+            # One each for the try, every except clause and a finally
+            counts["error_handling"] += 1 + len(node.handlers) + bool(node.finalbody)
+        elif isinstance(node, _ASYNC_NODES):
+            counts["async_code"] += 1
+        elif isinstance(node, ast.comprehension):
+            counts["async_code"] += node.is_async
+        elif isinstance(node, ast.AnnAssign):
+            counts["type_hints"] += 1
+        elif isinstance(node, ast.arg):
+            counts["type_hints"] += node.annotation is not None
+        elif isinstance(node, ast.Constant):
+            value = node.value
+            if isinstance(value, (int, float, complex)) and not isinstance(value, bool):
+                counts["magic_numbers"] += 1
+
+        if isinstance(node, _FUNCTION_NODES):
+            counts["type_hints"] += node.returns is not None
+        if isinstance(node, _DOCSTRING_NODES):
+            counts["docstrings"] += ast.get_docstring(node, clean=False) is not None
+    return counts
+
+@_memoize_by_digest(256)
+def _count_patterns(code: str, names: Tuple[str, ...]) -> Dict[str, Any]:
+    try:
+        counts = _count_tree_patterns(_parse_tree(code))
+    except (SyntaxError, ValueError):
+        counts = {}
+
+    patterns = {}
+    for name in names:
+        if name in counts and name != "todo_comments":
+            patterns[name] = counts[name]
+        else:
+            patterns[name] = len(_PATTERNS[name].findall(code))
+    return {
+        "success": True,
+        "patterns": patterns
+    }
+
 class CodeAnalyzer:
     """Code analysis tools for MCP server."""
 
     @staticmethod
+    @_memoize_by_digest(256)
     def analyze_complexity(code: str) -> Dict[str, Any]:
         """Analyze code complexity."""
         try:
-            tree = ast.parse(code)
+            tree = _parse_tree(code)
 
             # Initialize metrics
             metrics = {
@@ -44,25 +244,10 @@ class CodeAnalyzer:
                 "imports": [],
                 "function_names": [],
                 "class_names": [],
+                "truncated": False,
             }
 
-            # Collect imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        metrics["imports"].append(name.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for name in node.names:
-                        metrics["imports"].append(f"{module}.{name.name}")
-                elif isinstance(node, ast.FunctionDef):
-                    metrics["num_functions"] += 1
-                    metrics["function_names"].append(node.name)
-                    # Basic complexity scoring
-                    metrics["complexity_score"] += len(list(ast.walk(node)))
-                elif isinstance(node, ast.ClassDef):
-                    metrics["num_classes"] += 1
-                    metrics["class_names"].append(node.name)
+            metrics["complexity_score"] = _collect_complexity(tree, metrics)
 
             return {
                 "success": True,
@@ -75,32 +260,73 @@ class CodeAnalyzer:
             }
 
     @staticmethod
-    def analyze_patterns(code: str) -> Dict[str, Any]:
-        """Analyze code patterns and potential issues."""
-        patterns = {
-            "error_handling": len(re.findall(r'try|except|finally', code)),
-            "async_code": len(re.findall(r'async|await', code)),
-            "type_hints": len(re.findall(r':\s*[A-Za-z\[\]]+', code)),
-            "docstrings": len(re.findall(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', code)),
-            "todo_comments": len(re.findall(r'#\s*TODO', code)),
-            "magic_numbers": len(re.findall(r'\b\d+\b(?!\s*[=:]\s*[\'"]\w+)', code)),
-        }
+    def analyze_patterns(code: str, which: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Analyze code patterns and potential issues.
+
+        Args:
+            code: Source code to scan
+            which: Names of the patterns to count. Defaults to all of them,
+                except magic_numbers for code over MAGIC_NUMBERS_SIZE_LIMIT
+                characters.
+        """
+        if which is None:
+            names = tuple(
+                name for name in _PATTERNS
+                if name != "magic_numbers" or len(code) <= MAGIC_NUMBERS_SIZE_LIMIT
+            )
+        else:
+            requested = set(which)
+            names = tuple(name for name in _PATTERNS if name in requested)
+        return _count_patterns(code, names)
+
+@functools.lru_cache(maxsize=1)
+def _http_client() -> httpx.AsyncClient:
+    """Pooled async HTTP client shared by every provider client, so requests
+    never block the event loop and reuse keep-alive connections."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0
+        )
+    )
 
-        return {
-            "success": True,
-            "patterns": patterns
-        }
+@functools.lru_cache(maxsize=4)
+def _anthropic_client(api_key: Optional[str]) -> anthropic.AsyncAnthropic:
+    return anthropic.AsyncAnthropic(api_key=api_key, http_client=_http_client())
+
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: Optional[str]) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key, http_client=_http_client())
+
+async def close_provider_clients():
+    """Close the shared provider connection pool, if one was created."""
+    if _http_client.cache_info().currsize:
+        await _http_client().aclose()
+    _anthropic_client.cache_clear()
+    _openai_client.cache_clear()
+    _http_client.cache_clear()
 
 class ProviderSelector:
-    """Provider selection and management for MCP server."""
+    """Provider selection and management for MCP server.
 
-    def __init__(self):
-        self.anthropic_client = anthropic.Client(
-            api_key=os.getenv("ANTHROPIC_API_KEY")
-        )
-        self.openai_client = AsyncOpenAI(
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+    Provider clients are created on first use and shared by every selector
+    using the same API key.
+    """
+
+    @functools.cached_property
+    def anthropic_client(self) -> anthropic.AsyncAnthropic:
+        return _anthropic_client(os.getenv("ANTHROPIC_API_KEY"))
+
+    @functools.cached_property
+    def openai_client(self) -> AsyncOpenAI:
+        return _openai_client(os.getenv("OPENAI_API_KEY"))
+
+    async def aclose(self):
+        """Close pooled provider connections."""
+        await close_provider_clients()
+        self.__dict__.pop("anthropic_client", None)
+        self.__dict__.pop("openai_client", None)
 
     async def generate_code(
         self,
@@ -113,6 +339,9 @@ class ProviderSelector:
             if provider == "auto":
                 # Simple provider selection based on prompt characteristics
                 provider = self._select_provider(prompt)
+                # "openai" is the fallback guess, not a signal from the prompt
+                if RACE_PROVIDERS and provider == "openai":
+                    return await self._race_providers(prompt, **kwargs)
 
             if provider == "anthropic":
                 return await self._generate_anthropic(prompt, **kwargs)
@@ -126,6 +355,26 @@ class ProviderSelector:
                 "error": str(e)
             }
 
+    async def _race_providers(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Query both providers concurrently, returning the first success.
+
+        The slower request is cancelled. If both fail, the last failure is
+        returned.
+        """
+        tasks = [
+            asyncio.create_task(self._generate_anthropic(prompt, **kwargs)),
+            asyncio.create_task(self._generate_openai(prompt, **kwargs))
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result.get("success"):
+                    return result
+            return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _select_provider(self, prompt: str) -> ProviderType:
         """Select best provider based on prompt characteristics."""
         # Simple heuristic-based selection
@@ -192,38 +441,169 @@ class MCPPerformanceMonitor:
         self.metrics_file = self.data_dir / "performance_metrics.jsonl"
         self.current_session = datetime.now().isoformat()
 
+        # Metrics parsed so far and the byte offset of the first unread line
+        self._metrics_df = pd.DataFrame()
+        self._metrics_offset = 0
+
+        # Encoded metric lines are appended in batches by a background writer
+        # holding the file open; None asks it to stop
+        self._pending: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_metrics,
+            name="metrics-writer",
+            daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _write_metrics(self):
+        """Append queued metric lines, one write and flush per batch."""
+        with open(self.metrics_file, "ab", buffering=1 << 16) as f:
+            while True:
+                batch = [self._pending.get()]
+                while True:
+                    try:
+                        batch.append(self._pending.get_nowait())
+                    except queue.Empty:
+                        break
+
+                f.writelines(line for line in batch if line is not None)
+                f.flush()
+                for _ in batch:
+                    self._pending.task_done()
+                if None in batch:
+                    return
+
+    def flush(self):
+        """Block until every logged metric has been written."""
+        if self._writer.is_alive():
+            self._pending.join()
+
+    def close(self):
+        """Write pending metrics and stop the background writer."""
+        if self._writer.is_alive():
+            self._pending.put(None)
+            self._writer.join()
+
     def log_metric(self, metric_type: str, value: Any, metadata: Optional[Dict] = None):
-        """Log a performance metric."""
+        """Log a performance metric.
+
+        The metric is encoded immediately and written by the background writer.
+        """
         metric = {
-            "timestamp": datetime.now().isoformat(),
+            # orjson writes naive datetimes in the same form as isoformat()
+            "timestamp": datetime.now(),
             "session_id": self.current_session,
             "type": metric_type,
             "value": value,
             "metadata": metadata or {}
         }
 
-        with open(self.metrics_file, "a") as f:
-            f.write(json.dumps(metric) + "\n")
+        self._pending.put(orjson.dumps(metric, option=orjson.OPT_APPEND_NEWLINE))
+
+    def fingerprint(self) -> Tuple[int, int]:
+        """Identify the current metrics file contents by (mtime_ns, size)."""
+        self.flush()
+        try:
+            st = self.metrics_file.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_new_metrics(self):
+        """Parse lines appended to the metrics file since the last read."""
+        self.flush()
+        try:
+            size = self.metrics_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._metrics_offset:
+            # File was truncated or replaced; start over
+            self._metrics_df = pd.DataFrame()
+            self._metrics_offset = 0
+        if size == self._metrics_offset:
+            return
+
+        with open(self.metrics_file, "rb") as f:
+            f.seek(self._metrics_offset)
+            data = f.read()
+        # Leave a partially written last line for the next read
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return
+
+        new_df = pd.DataFrame([orjson.loads(line) for line in data[:end].splitlines() if line])
+        # Parse timestamps once here and keep the few metric types as
+        # categories, so filtering by type compares integer codes
+        new_df["timestamp"] = pd.to_datetime(new_df["timestamp"], format="ISO8601")
+        new_df["type"] = new_df["type"].astype("category")
+        if self._metrics_df.empty:
+            self._metrics_df = new_df
+        else:
+            types = union_categoricals([self._metrics_df["type"], new_df["type"]])
+            self._metrics_df = pd.concat([self._metrics_df, new_df], ignore_index=True)
+            self._metrics_df["type"] = types
+        self._metrics_offset += end
 
     def get_metrics(self, metric_type: Optional[str] = None) -> pd.DataFrame:
-        """Retrieve metrics as a pandas DataFrame."""
-        metrics = []
-        if self.metrics_file.exists():
-            with open(self.metrics_file) as f:
-                for line in f:
-                    metric = json.loads(line)
-                    if metric_type is None or metric["type"] == metric_type:
-                        metrics.append(metric)
-        return pd.DataFrame(metrics)
+        """Retrieve metrics as a pandas DataFrame.
+
+        Only lines appended since the previous call are parsed; earlier metrics
+        are kept in memory. "timestamp" is a datetime column and "type" is
+        categorical.
+        """
+        self._read_new_metrics()
+        metrics_df = self._metrics_df
+        if metric_type is not None and not metrics_df.empty:
+            return metrics_df[metrics_df["type"] == metric_type]
+        # Shallow copy so callers adding columns don't alter the cached frame
+        return metrics_df.copy(deep=False)
 
 class MCPVisualizer:
     """Visualization tools for MCP server analytics."""
 
     def __init__(self, monitor: MCPPerformanceMonitor):
         self.monitor = monitor
+        # (metrics file fingerprint, dashboard) from the last build
+        self._dashboard_cache: Optional[Tuple[Tuple[int, int], Dict[str, go.Figure]]] = None
+        self._dashboard_json_cache: Optional[
+            Tuple[Tuple[int, int], Dict[str, orjson.Fragment]]
+        ] = None
 
     def create_performance_dashboard(self) -> Dict[str, go.Figure]:
-        """Create a performance monitoring dashboard."""
+        """Create a performance monitoring dashboard.
+
+        The dashboard is rebuilt only when metrics were written since the last
+        build; otherwise the previous one is returned.
+        """
+        fingerprint = self.monitor.fingerprint()
+        if self._dashboard_cache is not None and self._dashboard_cache[0] == fingerprint:
+            return self._dashboard_cache[1]
+
+        dashboard = self._build_performance_dashboard()
+        self._dashboard_cache = (fingerprint, dashboard)
+        return dashboard
+
+    def performance_dashboard_json(self) -> Dict[str, orjson.Fragment]:
+        """Get the performance dashboard with each figure serialized to JSON.
+
+        Figures are serialized once per metrics update. The fragments are
+        embedded as-is when the response is encoded with orjson.
+        """
+        fingerprint = self.monitor.fingerprint()
+        cached = self._dashboard_json_cache
+        if cached is not None and cached[0] == fingerprint:
+            return dict(cached[1])
+
+        dashboard = {
+            name: orjson.Fragment(fig.to_json())
+            for name, fig in self.create_performance_dashboard().items()
+        }
+        self._dashboard_json_cache = (fingerprint, dashboard)
+        return dict(dashboard)
+
+    def _build_performance_dashboard(self) -> Dict[str, go.Figure]:
+        """Build the performance dashboard figures from the current metrics."""
         metrics_df = self.monitor.get_metrics()
 
         dashboard = {}
@@ -235,7 +615,7 @@ class MCPVisualizer:
 
             # Raw response times
             response_fig.add_trace(go.Scatter(
-                x=pd.to_datetime(response_times["timestamp"]),
+                x=response_times["timestamp"],
                 y=response_times["value"],
                 mode="lines+markers",
                 name="Response Time"
@@ -245,7 +625,7 @@ class MCPVisualizer:
             window_size = 5
             moving_avg = response_times["value"].rolling(window=window_size).mean()
             response_fig.add_trace(go.Scatter(
-                x=pd.to_datetime(response_times["timestamp"]),
+                x=response_times["timestamp"],
                 y=moving_avg,
                 mode="lines",
                 name=f"{window_size}-point Moving Average",
@@ -263,36 +643,33 @@ class MCPVisualizer:
         # 2. Tool usage sunburst chart
         tool_usage = metrics_df[metrics_df["type"] == "tool_usage"]
         if not tool_usage.empty:
-            # Create hierarchical structure
-            tool_hierarchy = {}
-            for _, row in tool_usage.iterrows():
-                tool_type = row["value"]
-                metadata = row["metadata"]
-                if tool_type not in tool_hierarchy:
-                    tool_hierarchy[tool_type] = {"count": 0, "subtypes": {}}
-                tool_hierarchy[tool_type]["count"] += 1
-
-                # Add metadata-based subtypes
-                if "status" in metadata:
-                    status = metadata["status"]
-                    if status not in tool_hierarchy[tool_type]["subtypes"]:
-                        tool_hierarchy[tool_type]["subtypes"][status] = 0
-                    tool_hierarchy[tool_type]["subtypes"][status] += 1
+            # Count tools and their metadata-based subtypes, in order of
+            # first appearance
+            tool_counts = tool_usage.groupby("value", sort=False).size()
+            subtype_counts = (
+                tool_usage.assign(status=tool_usage["metadata"].str.get("status"))
+                .dropna(subset=["status"])
+                .groupby(["value", "status"], sort=False)
+                .size()
+            )
+            subtypes = {}
+            for (tool, subtype), count in subtype_counts.items():
+                subtypes.setdefault(tool, []).append((subtype, count))
 
             # Convert to sunburst format
             labels = ["Tools"]  # Root
             parents = [""]  # Root has no parent
-            values = [sum(d["count"] for d in tool_hierarchy.values())]  # Total count
+            values = [int(tool_counts.sum())]  # Total count
 
-            for tool, data in tool_hierarchy.items():
+            for tool, count in tool_counts.items():
                 labels.append(tool)
                 parents.append("Tools")
-                values.append(data["count"])
+                values.append(int(count))
 
-                for subtype, count in data["subtypes"].items():
+                for subtype, subtype_count in subtypes.get(tool, []):
                     labels.append(f"{tool}-{subtype}")
                     parents.append(tool)
-                    values.append(count)
+                    values.append(int(subtype_count))
 
             usage_fig = go.Figure(go.Sunburst(
                 labels=labels,
@@ -306,12 +683,9 @@ class MCPVisualizer:
         # 3. Error rate timeline
         error_metrics = metrics_df[metrics_df["type"] == "command_received"].copy()
         if not error_metrics.empty:
-            error_metrics["has_error"] = error_metrics["metadata"].apply(
-                lambda x: x.get("status") == "error"
-            )
+            error_metrics["has_error"] = error_metrics["metadata"].str.get("status").eq("error")
 
             # Group by time intervals
-            error_metrics["timestamp"] = pd.to_datetime(error_metrics["timestamp"])
             hourly_errors = error_metrics.set_index("timestamp").resample("1H").agg({
                 "has_error": ["sum", "count"]
             })
@@ -338,11 +712,13 @@ class MCPVisualizer:
 
         # 4. Performance heatmap
         if not response_times.empty:
-            response_times["hour"] = pd.to_datetime(response_times["timestamp"]).dt.hour
-            response_times["day"] = pd.to_datetime(response_times["timestamp"]).dt.day_name()
+            timestamps = response_times["timestamp"]
 
             # Create pivot table for heatmap
-            heatmap_data = response_times.pivot_table(
+            heatmap_data = response_times.assign(
+                hour=timestamps.dt.hour,
+                day=timestamps.dt.day_name()
+            ).pivot_table(
                 values="value",
                 index="day",
                 columns="hour",
@@ -380,6 +756,10 @@ class MCPTools:
         self.provider_selector = ProviderSelector()
         self.code_analyzer = CodeAnalyzer()
 
+    async def aclose(self):
+        """Release network resources held by the tools."""
+        await self.provider_selector.aclose()
+
     async def process_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Process an MCP command with performance monitoring."""
         start_time = time.time()
@@ -448,6 +828,28 @@ class MCPTools:
             logger.error(f"Code generation error: {str(e)}")
             return {"error": f"Code generation failed: {str(e)}"}
 
+    def _analyze_code(
+        self,
+        code: str,
+        analysis_type: str,
+        patterns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Run the requested code analyses.
+
+        Both analyses share one cached parse tree and hold the GIL while
+        walking it, so they run one after the other in the calling thread
+        rather than in parallel threads that would each parse the code.
+        """
+        results = {}
+
+        if analysis_type in ["all", "complexity"]:
+            results["complexity"] = self.code_analyzer.analyze_complexity(code)
+
+        if analysis_type in ["all", "patterns"]:
+            results["patterns"] = self.code_analyzer.analyze_patterns(code, patterns)
+
+        return results
+
     async def _handle_code_analysis(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Handle code analysis commands."""
         code = command.get("code")
@@ -457,13 +859,13 @@ class MCPTools:
             return {"error": "No code provided"}
 
         try:
-            results = {}
-
-            if analysis_type in ["all", "complexity"]:
-                results["complexity"] = self.code_analyzer.analyze_complexity(code)
-
-            if analysis_type in ["all", "patterns"]:
-                results["patterns"] = self.code_analyzer.analyze_patterns(code)
+            # Analysis is CPU-bound; keep it off the event loop
+            results = await asyncio.to_thread(
+                self._analyze_code,
+                code,
+                analysis_type,
+                command.get("patterns")
+            )
 
             # Log tool usage
             self.monitor.log_metric("tool_usage", "code_analysis", {
@@ -497,7 +899,7 @@ class MCPTools:
             if analysis_type == "performance":
                 return {
                     "success": True,
-                    "visualizations": self.visualizer.create_performance_dashboard()
+                    "visualizations": self.visualizer.performance_dashboard_json()
                 }
             else:
                 return {"error": f"Unknown analysis type: {analysis_type}"}
@@ -509,7 +911,7 @@ class MCPTools:
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics and visualizations."""
         try:
-            dashboard = self.visualizer.create_performance_dashboard()
+            dashboard = self.visualizer.performance_dashboard_json()
             metrics_df = self.monitor.get_metrics()
 
             return {
@@ -14,15 +14,21 @@ setup(
         "typer>=0.9.0,<0.10",
         "rich>=13.7.0,<14",
         "requests>=2.31.0,<3",
+        "orjson>=3.9.0",
         "numpy>=1.24.0",
         "pandas>=2.1.0",
         "plotly>=5.18.0",
         "google-generativeai>=0.3.0",
     ],
     extras_require={
+        "fast": [
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.23.0",
+            "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.12.0",
             "flake8>=6.1.0",
             "mypy>=1.7.0",
@@ -59,14 +59,12 @@ def list_servers(
 ):
     """List all configured servers."""
     manager = MCPServerManager(config_path=config)
-    servers = manager.list_servers()
-
-    if not servers:
+    if not manager.servers["servers"]:
         console.print("[yellow]No servers configured[/yellow]")
         return
 
     if output_format == "json":
-        console.print_json(json.dumps(servers, indent=2))
+        console.print_json(json.dumps(manager.list_servers()))
         return
 
     # Create rich table
@@ -77,9 +75,9 @@ def list_servers(
     table.add_column("Tools", style="blue")
     table.add_column("Description")
 
-    for server in servers:
+    for name, server in manager.iter_servers():
         table.add_row(
-            server["name"],
+            name,
             server["url"],
             server["status"],
             ", ".join(server["tools"]) if server["tools"] else "None",
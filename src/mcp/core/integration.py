@@ -3,14 +3,42 @@ Integration module for connecting all MCP components.
 """
 from typing import Any, Dict, List, Optional
 import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
+
 from .base import BaseCognitiveTool, CognitiveToolResult
 from .collection import MetaCognitiveToolCollection
 from .evolution import CognitiveEvolutionTool
 from .meta_analysis import MetaAnalysisTool
 from ..tools import WebTool, GoogleTool, AnthropicTool
-from ..visualization import PatternVisualizer
+
+# External API tools, registered with the tool collection on first use
+EXTERNAL_TOOLS = {
+    "web_tool": WebTool,
+    "google_tool": GoogleTool,
+    "anthropic_tool": AnthropicTool
+}
+
+# Tools whose results depend only on their input, so repeated calls can be
+# answered from the result cache
+CACHEABLE_TOOLS = frozenset({"meta_analysis"})
+
+# Number of tool results kept by IntegratedCognitiveSystem
+RESULT_CACHE_SIZE = 256
+
+# Number of rendered visualizations remembered, so identical requests skip
+# rendering
+VISUALIZATION_CACHE_SIZE = 64
+
+# Most recent operations and patterns kept in the system state
+MAX_STATE_OPERATIONS = 1024
+MAX_STATE_PATTERNS = 4096
 
 class IntegratedCognitiveSystem:
     """
@@ -20,22 +48,42 @@ class IntegratedCognitiveSystem:
         # Initialize tool collection
         self.tool_collection = MetaCognitiveToolCollection()
 
-        # Initialize visualization
-        self.visualizer = PatternVisualizer(style="whitegrid")
-
-        # Initialize state tracking
+        # Initialize state tracking; only recent history is kept
         self.state = {
             "session_start": datetime.now().isoformat(),
-            "operations": [],
-            "patterns": [],
+            "operations": deque(maxlen=MAX_STATE_OPERATIONS),
+            "patterns": deque(maxlen=MAX_STATE_PATTERNS),
             "metrics": {}
         }
 
+        # Results of cacheable tool runs, keyed on a digest of their input
+        self._result_cache: "OrderedDict[bytes, CognitiveToolResult]" = OrderedDict()
+
+        # Rendering runs off the event loop on a single thread, since
+        # matplotlib's pyplot state is global and not thread-safe
+        self._viz_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="visualizer"
+        )
+        self._viz_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
         # Set up tools
         self._setup_tools()
 
+    @functools.cached_property
+    def visualizer(self):
+        """Pattern visualizer, created on first use so processes that never
+        visualize don't load matplotlib and seaborn."""
+        from ..visualization import PatternVisualizer
+        return PatternVisualizer(style="whitegrid")
+
     def _setup_tools(self):
-        """Initialize and register all tools."""
+        """Initialize and register the core tools.
+
+        External API tools are registered by _ensure_tool when first used.
+        """
+        self._external_tools = set()
+
         # Core cognitive tools
         self.tool_collection.register_tool(
             MetaAnalysisTool(self._get_analysis_config())
@@ -44,10 +92,12 @@ class IntegratedCognitiveSystem:
             CognitiveEvolutionTool(self._get_evolution_config())
         )
 
-        # External API tools
-        self.tool_collection.register_tool(WebTool())
-        self.tool_collection.register_tool(GoogleTool())
-        self.tool_collection.register_tool(AnthropicTool())
+    def _ensure_tool(self, tool_name: str):
+        """Register an external API tool the first time it is requested."""
+        tool_class = EXTERNAL_TOOLS.get(tool_name)
+        if tool_class is not None and tool_name not in self._external_tools:
+            self.tool_collection.register_tool(tool_class())
+            self._external_tools.add(tool_name)
 
     def _get_analysis_config(self) -> Dict[str, Any]:
         """Get meta-analysis configuration."""
@@ -87,7 +137,8 @@ class IntegratedCognitiveSystem:
         Process input through all relevant components.
 
         Args:
-            input_data: The input data to process
+            input_data: The input data to process. A true "cache_bypass"
+                forces a fresh run of a cacheable tool.
             analysis_type: Type of analysis to perform
             visualization_type: Type of visualization to generate
 
@@ -96,57 +147,89 @@ class IntegratedCognitiveSystem:
         """
         try:
             # Track operation start
-            operation_start = datetime.now()
-
-            # Process through tool collection
-            result = await self.tool_collection.run(
-                tool_name=input_data.get("tool", "meta_analysis"),
-                tool_input={
-                    "operation": input_data.get("operation", "analyze"),
-                    "data": input_data.get("data", {}),
-                    "analysis_type": analysis_type
-                }
-            )
+            operation_start = time.perf_counter_ns()
+
+            # Process through tool collection, reusing the result of an
+            # identical earlier run of a cacheable tool
+            tool_name = input_data.get("tool", "meta_analysis")
+            tool_input = {
+                "operation": input_data.get("operation", "analyze"),
+                "data": input_data.get("data", {}),
+                "analysis_type": analysis_type
+            }
+            key = None
+            if tool_name in CACHEABLE_TOOLS and not input_data.get("cache_bypass"):
+                key = self._digest([tool_name, tool_input])
+            result = self._result_cache.get(key) if key is not None else None
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            else:
+                self._ensure_tool(tool_name)
+                result = await self.tool_collection.run(
+                    tool_name=tool_name,
+                    tool_input=tool_input
+                )
+                if key is not None:
+                    self._result_cache[key] = result
+                    if len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
 
             # Update state
-            self._update_state(input_data, result, operation_start)
+            operation = self._update_state(input_data, result, operation_start)
 
-            # Generate visualizations if requested
+            # Generate visualizations if requested. Cached results are shared
+            # between requests, so the visualization is not stored on them
+            visualization = result.visualization
             if visualization_type:
-                viz_result = self._generate_visualization(
+                visualization = await self._visualize(
                     visualization_type,
                     result.data,
                     self.state
                 )
-                result.visualization = viz_result
 
             return {
                 "success": True,
                 "result": result.data,
                 "meta_analysis": result.metadata,
-                "state": self.state,
-                "visualization": getattr(result, "visualization", None)
+                "state": self._state_update([operation]),
+                "visualization": visualization
             }
 
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
-                "state": self.state
+                "state": self._state_update([])
             }
 
+    @staticmethod
+    def _digest(value: Any) -> Optional[bytes]:
+        """Digest a cache key's parts, or None if they can't be encoded."""
+        try:
+            encoded = orjson.dumps(
+                value,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
     def _update_state(
         self,
         input_data: Dict[str, Any],
         result: CognitiveToolResult,
-        operation_start: datetime
-    ):
-        """Update system state with operation results."""
-        operation_end = datetime.now()
-        operation_duration = (operation_end - operation_start).total_seconds()
+        operation_start: int
+    ) -> Dict[str, Any]:
+        """Update system state with operation results, returning the
+        recorded operation.
+
+        operation_start is a time.perf_counter_ns() reading. The timestamp is
+        stored as a datetime and formatted only when the state is encoded.
+        """
+        operation_duration = (time.perf_counter_ns() - operation_start) / 1e9
 
         operation = {
-            "timestamp": operation_end.isoformat(),
+            "timestamp": datetime.now(),
             "input": input_data,
             "result": result.data,
             "duration": operation_duration,
@@ -155,11 +238,63 @@ class IntegratedCognitiveSystem:
 
         self.state["operations"].append(operation)
 
-        if hasattr(result, "patterns"):
+        if result.patterns:
             self.state["patterns"].extend(result.patterns)
 
-        if hasattr(result, "metrics"):
-            self.state["metrics"].update(result.metrics)
+        # Metrics are replaced rather than updated in place, so replies still
+        # waiting to be sent keep the metrics they were built with
+        if result.metrics:
+            self.state["metrics"] = {**self.state["metrics"], **result.metrics}
+
+        return operation
+
+    def _state_update(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """State sent with a reply: the operations it performed, not the
+        whole history. Use get_state for a full snapshot."""
+        return {
+            "session_start": self.state["session_start"],
+            "operations": operations,
+            "metrics": self.state["metrics"]
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get a snapshot of the system state, with recent operations and
+        patterns as lists."""
+        return {
+            **self.state,
+            "operations": list(self.state["operations"]),
+            "patterns": list(self.state["patterns"])
+        }
+
+    async def _visualize(
+        self,
+        viz_type: str,
+        data: Dict[str, Any],
+        state: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate a visualization on the rendering thread.
+
+        A successful render is remembered, and a request for the same type and
+        data returns its result without rendering again.
+        """
+        key = self._digest(["visualization", viz_type, data])
+        cached = self._viz_cache.get(key) if key is not None else None
+        if cached is not None:
+            self._viz_cache.move_to_end(key)
+            return dict(cached)
+
+        viz_result = await asyncio.get_running_loop().run_in_executor(
+            self._viz_executor,
+            self._generate_visualization,
+            viz_type,
+            data,
+            state
+        )
+        if key is not None and viz_result.get("success"):
+            self._viz_cache[key] = viz_result
+            if len(self._viz_cache) > VISUALIZATION_CACHE_SIZE:
+                self._viz_cache.popitem(last=False)
+        return dict(viz_result)
 
     def _generate_visualization(
         self,
@@ -202,7 +337,7 @@ class IntegratedCognitiveSystem:
         """Cleanup resources and save final state."""
         # Save final state
         final_state = {
-            **self.state,
+            **self.get_state(),
             "session_end": datetime.now().isoformat()
         }
 
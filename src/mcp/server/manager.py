@@ -2,11 +2,14 @@
 MCP Server Management functionality.
 """
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from mcp.tools.integrated import (
     DeveloperTool,
@@ -15,6 +18,20 @@ from mcp.tools.integrated import (
     VisualizationTool
 )
 
+# Maximum concurrent requests sent to a single server
+MAX_REQUESTS_PER_HOST = 8
+
+# Tools that can be enabled on a server, by name
+VALID_TOOLS = {
+    "dev": DeveloperTool,
+    "advanced-dev": AdvancedDeveloperTools,
+    "memory": MemoryTool,
+    "visualization": VisualizationTool
+}
+
+# Raw config file contents keyed by path, valid while (mtime_ns, size) match
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, bytes]] = {}
+
 class MCPServerManager:
     """Manager for MCP servers and tools."""
 
@@ -28,15 +45,86 @@ class MCPServerManager:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         self.servers = self._load_config()
 
+        # Reuse keep-alive connections across calls to the same server
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=MAX_REQUESTS_PER_HOST)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def __enter__(self) -> "MCPServerManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load server configuration."""
-        if self.config_path.exists():
-            return json.loads(self.config_path.read_text())
-        return {"servers": {}}
+        """Load server configuration.
+
+        The file is only re-read when its mtime or size changed since the last
+        load in this process. Cached bytes are decoded on every call so each
+        manager gets its own copy.
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return {"servers": {}}
+
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+            cached = (st.st_mtime_ns, st.st_size, self.config_path.read_bytes())
+            _CONFIG_CACHE[self.config_path] = cached
+        return orjson.loads(cached[2])
 
     def _save_config(self):
-        """Save server configuration."""
-        self.config_path.write_text(json.dumps(self.servers, indent=2))
+        """Save server configuration.
+
+        Nothing is written when the file already holds the same contents.
+        Otherwise the file is replaced atomically so a crash mid-write cannot
+        leave a truncated config behind.
+        """
+        data = orjson.dumps(
+            self.servers,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is not None and cached[2] == data:
+            try:
+                st = self.config_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return
+
+        tmp_path = self.config_path.with_name(
+            f".{self.config_path.name}.{os.getpid()}.tmp"
+        )
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
+        st = self.config_path.stat()
+        _CONFIG_CACHE[self.config_path] = (st.st_mtime_ns, st.st_size, data)
+
+    @staticmethod
+    def _concurrent_requests(send: Callable[[str], Any], tools: List[str]) -> List[Any]:
+        """Send one request per tool concurrently, returning results in order.
+
+        Each result is the response, or the exception raised sending it.
+        """
+        def attempt(tool: str) -> Any:
+            try:
+                response = send(tool)
+                response.raise_for_status()
+                return response
+            except Exception as e:
+                return e
+
+        if not tools:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_REQUESTS_PER_HOST, len(tools))) as pool:
+            return list(pool.map(attempt, tools))
 
     def add_server(
         self,
@@ -51,7 +139,7 @@ class MCPServerManager:
             return False
 
         try:
-            response = requests.get(f"{url}/health")
+            response = self._session.get(f"{url}/health")
             response.raise_for_status()
         except Exception as e:
             print(f"Error connecting to server: {e}", file=sys.stderr)
@@ -83,6 +171,13 @@ class MCPServerManager:
             for name, config in self.servers["servers"].items()
         ]
 
+    def iter_servers(self) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+        """Iterate over (name, config) of all configured servers.
+
+        Unlike list_servers, configs are not copied; treat them as read-only.
+        """
+        return iter(self.servers["servers"].items())
+
     def add_tools(self, name: str, tools: List[str]) -> bool:
         """Add tools to a server."""
         if name not in self.servers["servers"]:
@@ -92,34 +187,30 @@ class MCPServerManager:
         server = self.servers["servers"][name]
         url = server["url"]
 
-        valid_tools = {
-            "dev": DeveloperTool,
-            "advanced-dev": AdvancedDeveloperTools,
-            "memory": MemoryTool,
-            "visualization": VisualizationTool
-        }
-
-        invalid_tools = set(tools) - set(valid_tools.keys())
+        invalid_tools = [tool for tool in dict.fromkeys(tools) if tool not in VALID_TOOLS]
         if invalid_tools:
             print(f"Invalid tools: {', '.join(invalid_tools)}", file=sys.stderr)
             return False
 
-        try:
-            for tool in tools:
-                if tool not in server["tools"]:
-                    response = requests.post(
-                        f"{url}/tools",
-                        json={"tool": tool}
-                    )
-                    response.raise_for_status()
-                    server["tools"].append(tool)
-
-            self._save_config()
-            return True
+        new_tools = [tool for tool in dict.fromkeys(tools) if tool not in server["tools"]]
+        results = self._concurrent_requests(
+            lambda tool: self._session.post(f"{url}/tools", json={"tool": tool}),
+            new_tools
+        )
 
-        except Exception as e:
-            print(f"Error adding tools: {e}", file=sys.stderr)
+        # Record the tools that were added even if others failed
+        errors = []
+        for tool, result in zip(new_tools, results):
+            if isinstance(result, Exception):
+                errors.append(f"{tool}: {result}")
+            else:
+                server["tools"].append(tool)
+
+        self._save_config()
+        if errors:
+            print(f"Error adding tools: {'; '.join(errors)}", file=sys.stderr)
             return False
+        return True
 
     def remove_tools(self, name: str, tools: List[str]) -> bool:
         """Remove tools from a server."""
@@ -130,18 +221,22 @@ class MCPServerManager:
         server = self.servers["servers"][name]
         url = server["url"]
 
-        try:
-            for tool in tools:
-                if tool in server["tools"]:
-                    response = requests.delete(
-                        f"{url}/tools/{tool}"
-                    )
-                    response.raise_for_status()
-                    server["tools"].remove(tool)
+        old_tools = [tool for tool in dict.fromkeys(tools) if tool in server["tools"]]
+        results = self._concurrent_requests(
+            lambda tool: self._session.delete(f"{url}/tools/{tool}"),
+            old_tools
+        )
 
-            self._save_config()
-            return True
+        # Record the tools that were removed even if others failed
+        errors = []
+        for tool, result in zip(old_tools, results):
+            if isinstance(result, Exception):
+                errors.append(f"{tool}: {result}")
+            else:
+                server["tools"].remove(tool)
 
-        except Exception as e:
-            print(f"Error removing tools: {e}", file=sys.stderr)
-            return False
\ No newline at end of file
+        self._save_config()
+        if errors:
+            print(f"Error removing tools: {'; '.join(errors)}", file=sys.stderr)
+            return False
+        return True
\ No newline at end of file
@@ -4,25 +4,35 @@ Integrated MCP tools.
 
 class BaseTool:
     """Base class for all MCP tools."""
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
 class DeveloperTool(BaseTool):
     """Basic developer tools."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("dev")
 
 class AdvancedDeveloperTools(BaseTool):
     """Advanced developer tools."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("advanced-dev")
 
 class MemoryTool(BaseTool):
     """Memory management tools."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("memory")
 
 class VisualizationTool(BaseTool):
     """Visualization tools."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("visualization")
\ No newline at end of file
@@ -2,20 +2,153 @@
 Integration layer for Node.js and Python components.
 """
 import asyncio
-import json
+import contextlib
+import os
 import sys
-from typing import Any, Dict, Optional
+import tempfile
+from typing import Any, Dict, Optional, Union
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # optional, falls back to the default event loop
+    uvloop = None
 
 from ..core.integration import IntegratedCognitiveSystem
 
+# MAX_FRAME_SIZE, _stdin_reader, _read_frame and _REPLY_OPTIONS are kept in
+# step with src/python/src/tools/tool_server.py, which speaks the same protocol
+# from a separately deployed package; fix both copies together.
+
+# Largest frame accepted from Node.js, in bytes
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Requests processed concurrently before reading further frames waits
+MAX_IN_FLIGHT = 64
+
+async def _stdin_reader() -> asyncio.StreamReader:
+    """Read stdin through the event loop instead of a thread per line."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_FRAME_SIZE)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        sys.stdin
+    )
+    return reader
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one newline-terminated frame, or b'' at end of input.
+
+    A frame longer than the reader's limit is discarded up to and including
+    its newline, then reported with a single ValueError, so the next frame
+    is read intact and replies stay paired with requests.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        # Input ended; the last frame may lack its newline
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            break
+        except asyncio.IncompleteReadError:
+            break
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+    raise ValueError(f"Frame longer than {MAX_FRAME_SIZE} bytes")
+
+# orjson options for reply lines: newline-terminated, and like json.dumps,
+# non-string keys are written as strings
+_REPLY_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Encode one reply as a JSON line."""
+    return orjson.dumps(
+        message,
+        option=_REPLY_OPTIONS
+    )
+
+# Fixed replies, encoded once
+_ERR_BAD_JSON = _encode({"success": False, "error": "Invalid JSON input"})
+
+def _write(data: bytes):
+    """Write encoded replies to Node.js with a single write and flush."""
+    out = sys.stdout.buffer
+    out.write(data)
+    out.flush()
+
+async def _reply(message: Union[Dict[str, Any], bytes]) -> Union[Dict[str, Any], bytes]:
+    """Reply with a message, or an already encoded one, that needs no
+    processing."""
+    return message
+
+async def _encode_reply(task: asyncio.Task) -> bytes:
+    """Wait for a request's reply and encode it, or an error in its place."""
+    try:
+        reply = await task
+        return reply if isinstance(reply, bytes) else _encode(reply)
+    except Exception as e:
+        return _encode({
+            "success": False,
+            "error": str(e)
+        })
+
+async def _send_replies(replies: "asyncio.Queue[Optional[asyncio.Task]]"):
+    """Send each queued request's reply, in request order, until None.
+
+    Replies that are ready together are written in one batch; a batch is
+    sent as soon as the next reply would have to be waited for.
+    """
+    buf = bytearray()
+    while True:
+        task = await replies.get()
+        if buf and (task is None or not task.done()):
+            with contextlib.suppress(OSError):
+                _write(buf)
+            buf.clear()
+        if task is None:
+            replies.task_done()
+            return
+
+        buf += await _encode_reply(task)
+        replies.task_done()
+        if replies.empty():
+            with contextlib.suppress(OSError):
+                _write(buf)
+            buf.clear()
+
+def _write_state_file(state: Dict[str, Any]) -> str:
+    """Write a final state snapshot to a new temporary file, returning its
+    path."""
+    fd, path = tempfile.mkstemp(prefix="mcp-state-", suffix=".json")
+    with os.fdopen(fd, "wb") as f:
+        f.write(orjson.dumps(
+            state,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+        ))
+    return path
+
 class NodeJSIntegration:
     """
     Handles communication between Node.js and Python components.
     """
     def __init__(self):
         self.cognitive_system = IntegratedCognitiveSystem()
-        self.input_queue = asyncio.Queue()
-        self.output_queue = asyncio.Queue()
+
+        # Request handlers by action
+        self._handlers = {
+            "process": self._handle_process,
+            "analyze": self._handle_analyze,
+            "visualize": self._handle_visualize,
+            "cleanup": self._handle_cleanup
+        }
 
     async def handle_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process input from Node.js."""
@@ -27,14 +160,7 @@ class NodeJSIntegration:
                     "error": "No action specified"
                 }
 
-            handlers = {
-                "process": self._handle_process,
-                "analyze": self._handle_analyze,
-                "visualize": self._handle_visualize,
-                "cleanup": self._handle_cleanup
-            }
-
-            handler = handlers.get(action)
+            handler = self._handlers.get(action)
             if not handler:
                 return {
                     "success": False,
@@ -76,50 +202,71 @@ class NodeJSIntegration:
         )
 
     async def _handle_cleanup(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle cleanup requests."""
+        """Handle cleanup requests.
+
+        The reply carries a summary of the final state; the full state is
+        written to a JSON file whose path is returned as "state_file".
+        """
         final_state = await self.cognitive_system.cleanup()
+        state_file = await asyncio.to_thread(_write_state_file, final_state)
         return {
             "success": True,
-            "final_state": final_state
+            "summary": {
+                "session_start": final_state["session_start"],
+                "session_end": final_state["session_end"],
+                "operations": len(final_state["operations"]),
+                "patterns": len(final_state["patterns"])
+            },
+            "state_file": state_file
         }
 
     async def run(self):
-        """Main processing loop."""
-        while True:
-            try:
+        """Main processing loop.
+
+        Each request starts as soon as it is read, so independent requests
+        run concurrently; replies are still sent in request order.
+        """
+        reader = await _stdin_reader()
+        replies: "asyncio.Queue[Optional[asyncio.Task]]" = asyncio.Queue(
+            maxsize=MAX_IN_FLIGHT
+        )
+        sender = asyncio.create_task(_send_replies(replies))
+        try:
+            while True:
                 # Read input from Node.js
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                try:
+                    line = await _read_frame(reader)
+                except ValueError as e:
+                    await replies.put(asyncio.create_task(_reply({
+                        "success": False,
+                        "error": str(e)
+                    })))
+                    continue
                 if not line:
                     break
 
                 # Parse input data
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    print(json.dumps({
-                        "success": False,
-                        "error": "Invalid JSON input"
-                    }), flush=True)
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    await replies.put(asyncio.create_task(_reply(_ERR_BAD_JSON)))
                     continue
 
-                # Process the request
-                result = await self.handle_input(data)
+                # Cleanup tears down the tools, so earlier requests finish first
+                if isinstance(data, dict) and data.get("action") == "cleanup":
+                    await replies.join()
 
-                # Send response back to Node.js
-                print(json.dumps(result), flush=True)
-
-            except Exception as e:
-                print(json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }), flush=True)
+                # Process the request; its reply is sent once it completes
+                await replies.put(asyncio.create_task(self.handle_input(data)))
+        finally:
+            await replies.put(None)
+            await sender
 
 def main():
     """Entry point for Node.js integration."""
     integration = NodeJSIntegration()
-    asyncio.run(integration.run())
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(integration.run())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, TypeVar
 
 from anthropic.types.beta import BetaToolUnionParam
@@ -15,6 +15,9 @@ class CognitiveToolResult(Generic[T]):
     data: T | None = None
     error: str | None = None
     metadata: dict[str, Any] | None = None
+    patterns: list[Any] = field(default_factory=list)
+    metrics: dict[str, Any] = field(default_factory=dict)
+    visualization: dict[str, Any] | None = None
 
     def __bool__(self) -> bool:
         return self.success
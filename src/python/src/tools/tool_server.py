@@ -2,10 +2,16 @@
 Tool server for handling integration between JavaScript and Python components.
 """
 import asyncio
-import json
 import sys
 from typing import Dict, Any
 
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # optional, falls back to the default event loop
+    uvloop = None
+
 from cognitive_framework.tools import (
     CognitiveToolCollection,
     MetaAnalysisTool,
@@ -17,6 +23,71 @@ from google_tool import GoogleTool
 from mojo_tools import MojoStructureTool
 from visualization.pattern_viz import PatternVisualizer
 
+# MAX_FRAME_SIZE, _stdin_reader, _read_frame and _REPLY_OPTIONS are kept in
+# step with src/mcp/tools/js_integration.py, which speaks the same protocol
+# from a separately deployed package; fix both copies together.
+
+# Largest frame accepted from Node.js, in bytes
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+async def _stdin_reader() -> asyncio.StreamReader:
+    """Read stdin through the event loop instead of a thread per line."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_FRAME_SIZE)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        sys.stdin
+    )
+    return reader
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one newline-terminated frame, or b'' at end of input.
+
+    A frame longer than the reader's limit is discarded up to and including
+    its newline, then reported with a single ValueError, so the next frame
+    is read intact and replies stay paired with requests.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        # Input ended; the last frame may lack its newline
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            break
+        except asyncio.IncompleteReadError:
+            break
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+    raise ValueError(f"Frame longer than {MAX_FRAME_SIZE} bytes")
+
+# orjson options for reply lines: newline-terminated, and like json.dumps,
+# non-string keys are written as strings
+_REPLY_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+def _write(data: bytes):
+    """Write encoded JSON lines to Node.js."""
+    sys.stdout.buffer.write(data)
+    sys.stdout.flush()
+
+def _send(message: Dict[str, Any]):
+    """Write one JSON line to Node.js."""
+    _write(orjson.dumps(
+        message,
+        option=_REPLY_OPTIONS
+    ))
+
+# Fixed replies, encoded once
+_ERR_BAD_JSON = orjson.dumps(
+    {"success": False, "error": "Invalid JSON input"},
+    option=orjson.OPT_APPEND_NEWLINE
+)
+
 class ToolServer:
     def __init__(self):
         # Initialize tool configuration
@@ -57,6 +128,16 @@ class ToolServer:
         self.tool_collection = MetaCognitiveToolCollection()
         self.setup_tools()
 
+        # Request handlers by action
+        self.action_handlers = {
+            "analyze": self.handle_analysis,
+            "evolve": self.handle_evolution,
+            "web_request": self.handle_web_request,
+            "google_search": self.handle_google_search,
+            "mojo_structure": self.handle_mojo_structure,
+            "visualize": self.handle_visualization
+        }
+
     def setup_tools(self):
         """Initialize and register all tools."""
         # Register meta-analysis tool
@@ -85,16 +166,7 @@ class ToolServer:
         action = data.get("action")
         input_data = data.get("data", {})
 
-        action_handlers = {
-            "analyze": self.handle_analysis,
-            "evolve": self.handle_evolution,
-            "web_request": self.handle_web_request,
-            "google_search": self.handle_google_search,
-            "mojo_structure": self.handle_mojo_structure,
-            "visualize": self.handle_visualization
-        }
-
-        handler = action_handlers.get(action)
+        handler = self.action_handlers.get(action)
         if handler:
             return await handler(input_data)
         else:
@@ -256,35 +328,32 @@ class ToolServer:
 
     async def run(self):
         """Main server loop."""
+        reader = await _stdin_reader()
         while True:
             try:
                 # Read input from Node.js
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                line = await _read_frame(reader)
                 if not line:
                     break
 
                 # Parse input data
-                data = json.loads(line)
+                data = orjson.loads(line)
 
                 # Process the request
                 result = await self.process_input(data)
 
                 # Send response back to Node.js
-                print(json.dumps(result), flush=True)
+                _send(result)
 
-            except json.JSONDecodeError:
-                print(json.dumps({
-                    "success": False,
-                    "error": "Invalid JSON input"
-                }), flush=True)
+            except orjson.JSONDecodeError:
+                _write(_ERR_BAD_JSON)
             except Exception as e:
-                print(json.dumps({
+                _send({
                     "success": False,
                     "error": str(e)
-                }), flush=True)
+                })
 
 if __name__ == "__main__":
     server = ToolServer()
-    asyncio.run(server.run())
\ No newline at end of file
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(server.run())
\ No newline at end of file
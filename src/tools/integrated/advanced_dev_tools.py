@@ -2,10 +2,16 @@
 Advanced development tools for MCP providing CI, testing, linting, and documentation capabilities.
 """
 
+import hashlib
+import importlib.util
 import json
+import os
 import subprocess
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from datetime import datetime
 
 from anthropic.types.beta import BetaToolUnionParam
@@ -14,6 +20,112 @@ from ..base import BaseCognitiveTool, CognitiveToolResult
 from .dev_tools import DeveloperTool
 from .memory_tools import MemoryTool
 
+# Files mypy reads its configuration from; the cache directory is keyed on
+# their contents so switching configurations doesn't invalidate the cache
+MYPY_CONFIG_FILES = ('mypy.ini', '.mypy.ini', 'pyproject.toml', 'setup.cfg')
+
+# Directories the linters check and the files configuring them. Passing
+# linters are not rerun until one of these files changes
+LINT_PATHS = ('src', 'tests')
+LINT_CONFIG_FILES = MYPY_CONFIG_FILES + ('.flake8', 'tox.ini', 'ruff.toml', '.ruff.toml')
+
+# Directory under the workspace root holding each linter's last passing result
+LINT_CACHE_DIR = '.mcp_lint_cache'
+
+
+# Valid operations and, for each, the values of its type argument
+_VALID_OPERATIONS = {
+    'test': frozenset({'pytest', 'tox', 'coverage', 'e2e'}),
+    'lint': frozenset({'black', 'flake8', 'mypy', 'all'}),
+    'ci': frozenset(),
+    'docs': frozenset({'sphinx', 'mkdocs'}),
+    'container': frozenset({'build', 'test', 'run'}),
+    'job_status': frozenset()
+}
+
+# JSON schema of the tool's arguments
+_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": [
+                "test", "lint", "ci", "docs", "container", "job_status"
+            ],
+            "description": "Operation to perform"
+        },
+        "test_type": {
+            "type": "string",
+            "enum": ["pytest", "tox", "coverage", "e2e"],
+            "description": "Type of test to run"
+        },
+        "lint_type": {
+            "type": "string",
+            "enum": ["black", "flake8", "mypy", "all"],
+            "description": "Type of linting"
+        },
+        "doc_type": {
+            "type": "string",
+            "enum": ["sphinx", "mkdocs"],
+            "description": "Type of documentation"
+        },
+        "container_op": {
+            "type": "string",
+            "enum": ["build", "test", "run"],
+            "description": "Container operation"
+        },
+        "cache_ref": {
+            "type": "string",
+            "description": "Image to reuse cached layers from when building"
+        },
+        "targets": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Image tags for the container operation"
+        },
+        "parallel": {
+            "type": "boolean",
+            "description": (
+                "Shard pytest runs across cores (default). Skipped when "
+                "pytest-xdist is not installed or extra_args already set -n"
+            )
+        },
+        "async_run": {
+            "type": "boolean",
+            "description": "Run tests in the background"
+        },
+        "job_id": {
+            "type": "string",
+            "description": "Background test job to report on"
+        },
+        "write": {
+            "type": "boolean",
+            "description": "Let linters fix the files instead of only checking them"
+        },
+        "store_results": {
+            "type": "boolean",
+            "description": "Whether to store results in memory"
+        },
+        "extra_args": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Additional arguments"
+        }
+    },
+    "required": ["operation"]
+}
+
+
+def _can_add_xdist_args(extra_args: List[str]) -> bool:
+    """Whether pytest-xdist is installed and extra_args leave the worker
+    count to us."""
+    if importlib.util.find_spec('xdist') is None:
+        return False
+    return not any(
+        arg.startswith('-n') or arg.startswith('--numprocesses')
+        for arg in extra_args
+    )
+
 
 class AdvancedDeveloperTools(BaseCognitiveTool):
     """Advanced development tools including CI, testing, linting, and documentation."""
@@ -34,19 +146,51 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
         """
         self.workspace_root = workspace_root or Path.cwd()
         self.dev_tool = DeveloperTool(workspace_root=workspace_root)
-        self.memory_tool = memory_tool or MemoryTool()
+        self._memory_tool = memory_tool
+        # Background test runs by job id
+        self._jobs: Dict[str, threading.Thread] = {}
+        # Results waiting to be written to memory together by _flush_stores
+        self._pending_stores: List[Tuple[str, Any, List[str]]] = []
+        self._stores_lock = threading.Lock()
+
+    @property
+    def memory_tool(self) -> MemoryTool:
+        """MemoryTool for storing results, created on first use."""
+        if self._memory_tool is None:
+            self._memory_tool = MemoryTool()
+        return self._memory_tool
+
+    def close(self):
+        """Close the memory tool's database connection, if one was opened."""
+        if self._memory_tool is not None:
+            self._memory_tool.close()
 
     def __call__(self, **kwargs) -> CognitiveToolResult:
         """Execute an advanced development operation.
 
         Args:
-            operation: The operation to perform ('test', 'lint', 'docs', 'container')
-            test_type: Type of test to run ('tox', 'coverage', 'e2e')
+            operation: The operation to perform ('test', 'lint', 'ci', 'docs',
+                'container', 'job_status')
+            test_type: Type of test to run ('pytest', 'tox', 'coverage', 'e2e')
             lint_type: Type of linting ('black', 'flake8', 'mypy', 'all')
             doc_type: Type of documentation ('sphinx', 'mkdocs')
             container_op: Container operation ('build', 'test', 'run')
+            targets: Image tags for the container operation, run concurrently.
+                Defaults to the single image 'mcp'
+            cache_ref: Image whose layers seed container builds, typically
+                pushed from an earlier build in CI
             store_results: Whether to store results in memory
-            extra_args: Additional arguments for the operation
+            write: Let black reformat and ruff fix the files instead of only
+                checking them (for 'lint' operation)
+            parallel: Shard pytest runs across cores with pytest-xdist;
+                defaults to True, but is skipped when pytest-xdist isn't
+                installed or extra_args already set a worker count (for
+                'test' and 'ci' operations)
+            async_run: Run tests in the background and return a job id at once
+                (for 'test' operation)
+            job_id: Background test job to report on (for 'job_status' operation)
+            extra_args: Additional arguments for the operation; for 'ci' they
+                are passed to the tests only
         """
         if not self.validate_args(**kwargs):
             return CognitiveToolResult(
@@ -56,17 +200,36 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
 
         operation = kwargs.get('operation')
         try:
-            if operation == 'test':
+            if operation == 'test' and kwargs.get('async_run'):
+                result = self._start_test_job(
+                    kwargs.get('test_type', 'pytest'),
+                    kwargs.get('extra_args', []),
+                    kwargs.get('store_results', True),
+                    kwargs.get('parallel', True)
+                )
+            elif operation == 'test':
                 result = self._run_tests(
                     kwargs.get('test_type', 'pytest'),
                     kwargs.get('extra_args', []),
-                    kwargs.get('store_results', True)
+                    kwargs.get('store_results', True),
+                    kwargs.get('parallel', True)
                 )
+            elif operation == 'job_status':
+                result = self._job_status(kwargs['job_id'])
             elif operation == 'lint':
                 result = self._run_linting(
                     kwargs.get('lint_type', 'all'),
                     kwargs.get('extra_args', []),
-                    kwargs.get('store_results', True)
+                    kwargs.get('store_results', True),
+                    kwargs.get('write', False)
+                )
+            elif operation == 'ci':
+                result = self._run_ci(
+                    kwargs.get('test_type', 'pytest'),
+                    kwargs.get('lint_type', 'all'),
+                    kwargs.get('extra_args', []),
+                    kwargs.get('store_results', True),
+                    kwargs.get('parallel', True)
                 )
             elif operation == 'docs':
                 result = self._build_docs(
@@ -76,7 +239,9 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             elif operation == 'container':
                 result = self._container_ops(
                     kwargs.get('container_op', 'build'),
-                    kwargs.get('extra_args', [])
+                    kwargs.get('extra_args', []),
+                    kwargs.get('targets'),
+                    kwargs.get('cache_ref')
                 )
             else:
                 return CognitiveToolResult(
@@ -93,6 +258,8 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
                 success=False,
                 error=str(e)
             )
+        finally:
+            self._flush_stores()
 
     def to_anthropic_param(self) -> BetaToolUnionParam:
         """Convert to Anthropic tool parameter format."""
@@ -101,46 +268,7 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["test", "lint", "docs", "container"],
-                            "description": "Operation to perform"
-                        },
-                        "test_type": {
-                            "type": "string",
-                            "enum": ["tox", "coverage", "e2e"],
-                            "description": "Type of test to run"
-                        },
-                        "lint_type": {
-                            "type": "string",
-                            "enum": ["black", "flake8", "mypy", "all"],
-                            "description": "Type of linting"
-                        },
-                        "doc_type": {
-                            "type": "string",
-                            "enum": ["sphinx", "mkdocs"],
-                            "description": "Type of documentation"
-                        },
-                        "container_op": {
-                            "type": "string",
-                            "enum": ["build", "test", "run"],
-                            "description": "Container operation"
-                        },
-                        "store_results": {
-                            "type": "boolean",
-                            "description": "Whether to store results in memory"
-                        },
-                        "extra_args": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Additional arguments"
-                        }
-                    },
-                    "required": ["operation"]
-                }
+                "parameters": _PARAMETERS
             }
         }
 
@@ -150,28 +278,32 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             return False
 
         operation = kwargs['operation']
-        valid_operations = {
-            'test': ['tox', 'coverage', 'e2e'],
-            'lint': ['black', 'flake8', 'mypy', 'all'],
-            'docs': ['sphinx', 'mkdocs'],
-            'container': ['build', 'test', 'run']
-        }
-
-        if operation not in valid_operations:
+        if operation not in _VALID_OPERATIONS:
+            return False
+        if not isinstance(kwargs.get('parallel', True), bool):
             return False
 
         if operation == 'test' and 'test_type' in kwargs:
-            if kwargs['test_type'] not in valid_operations['test']:
+            if kwargs['test_type'] not in _VALID_OPERATIONS['test']:
                 return False
-        elif operation == 'lint' and 'lint_type' in kwargs:
-            if kwargs['lint_type'] not in valid_operations['lint']:
+        elif operation == 'lint':
+            if kwargs.get('lint_type', 'all') not in _VALID_OPERATIONS['lint']:
+                return False
+            if not isinstance(kwargs.get('write', False), bool):
+                return False
+        elif operation == 'ci':
+            if kwargs.get('test_type', 'pytest') not in _VALID_OPERATIONS['test']:
+                return False
+            if kwargs.get('lint_type', 'all') not in _VALID_OPERATIONS['lint']:
                 return False
         elif operation == 'docs' and 'doc_type' in kwargs:
-            if kwargs['doc_type'] not in valid_operations['docs']:
+            if kwargs['doc_type'] not in _VALID_OPERATIONS['docs']:
                 return False
         elif operation == 'container' and 'container_op' in kwargs:
-            if kwargs['container_op'] not in valid_operations['container']:
+            if kwargs['container_op'] not in _VALID_OPERATIONS['container']:
                 return False
+        elif operation == 'job_status' and 'job_id' not in kwargs:
+            return False
 
         return True
 
@@ -179,17 +311,37 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
         self,
         test_type: str,
         extra_args: List[str],
-        store_results: bool
+        store_results: bool,
+        parallel: bool = True
     ) -> Dict[str, Any]:
-        """Run tests with the specified configuration."""
+        """Run tests with the specified configuration.
+
+        pytest runs are sharded across cores with pytest-xdist when parallel
+        is set, pytest-xdist is installed and extra_args don't already choose
+        a worker count.
+        """
         timestamp = datetime.utcnow().isoformat()
         result = {}
 
-        if test_type == 'tox':
+        if parallel and _can_add_xdist_args(extra_args):
+            # Leave two cores free for the calling process and the editor
+            workers = max(1, (os.cpu_count() or 1) - 2)
+            xdist_args = ['-n', str(workers), '--dist=loadfile']
+        else:
+            xdist_args = []
+
+        if test_type == 'pytest':
+            cmd_result = self.dev_tool(
+                operation='shell',
+                command=['pytest', *xdist_args, *extra_args]
+            )
+            result['pytest'] = cmd_result.data
+
+        elif test_type == 'tox':
             # Run tox for multi-environment testing
             cmd_result = self.dev_tool(
                 operation='shell',
-                command=f"tox {' '.join(extra_args)}"
+                command=['tox', *extra_args]
             )
             result['tox'] = cmd_result.data
 
@@ -197,7 +349,10 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             # Run pytest with coverage
             cmd_result = self.dev_tool(
                 operation='shell',
-                command=f"pytest --cov=src --cov-report=html {' '.join(extra_args)}"
+                command=[
+                    'pytest', *xdist_args, '--cov=src', '--cov-report=html',
+                    '--cov-report=xml', *extra_args
+                ]
             )
             result['coverage'] = cmd_result.data
 
@@ -211,66 +366,252 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             # Run end-to-end tests with playwright
             cmd_result = self.dev_tool(
                 operation='shell',
-                command=f"playwright test {' '.join(extra_args)}"
+                command=['playwright', 'test', *extra_args]
             )
             result['e2e'] = cmd_result.data
 
         # Store results if requested
         if store_results and result:
-            self.memory_tool(
-                operation='store',
-                key=f"test_results_{test_type}_{timestamp}",
-                data=result,
-                tags=['test', test_type, timestamp[:10]]
+            self._store(
+                f"test_results_{test_type}_{timestamp}",
+                result,
+                ['test', test_type, timestamp[:10]]
             )
 
         return result
 
+    def _store(self, key: str, data: Any, tags: List[str]):
+        """Queue a result to be stored in memory by _flush_stores."""
+        with self._stores_lock:
+            self._pending_stores.append((key, data, tags))
+
+    def _flush_stores(self):
+        """Store queued results in a single transaction."""
+        with self._stores_lock:
+            entries, self._pending_stores = self._pending_stores, []
+        if entries:
+            self.memory_tool(operation='store_bulk', entries=entries)
+
+    def _start_test_job(
+        self,
+        test_type: str,
+        extra_args: List[str],
+        store_results: bool,
+        parallel: bool = True
+    ) -> Dict[str, Any]:
+        """Start a test run in the background.
+
+        The result is stored under async_test_<job_id> when the run ends;
+        poll it with the 'job_status' operation.
+        """
+        job_id = uuid.uuid4().hex
+        # Create the MemoryTool here rather than racing the job thread for it
+        self.memory_tool
+        job = threading.Thread(
+            target=self._await_test_job,
+            args=(job_id, test_type, extra_args, store_results, parallel),
+            name=f"test-job-{job_id}",
+            daemon=True
+        )
+        self._jobs[job_id] = job
+        job.start()
+        return {'job_id': job_id, 'status': 'running'}
+
+    def _await_test_job(
+        self,
+        job_id: str,
+        test_type: str,
+        extra_args: List[str],
+        store_results: bool,
+        parallel: bool = True
+    ):
+        """Run a background test job and store its outcome."""
+        try:
+            data = {
+                'status': 'completed',
+                'result': self._run_tests(test_type, extra_args, store_results, parallel)
+            }
+        except Exception as e:
+            data = {'status': 'failed', 'error': str(e)}
+
+        self._flush_stores()
+        self.memory_tool(
+            operation='store',
+            key=f"async_test_{job_id}",
+            data={'job_id': job_id, 'test_type': test_type, **data},
+            tags=['test', 'async', test_type]
+        )
+        self._jobs.pop(job_id, None)
+
+    def _job_status(self, job_id: str) -> Dict[str, Any]:
+        """Report on a background test job."""
+        stored = self.memory_tool(operation='retrieve', key=f"async_test_{job_id}").data
+        if stored is not None:
+            return stored['data']
+        if job_id in self._jobs:
+            return {'job_id': job_id, 'status': 'running'}
+        return {'job_id': job_id, 'status': 'unknown'}
+
     def _run_linting(
         self,
         lint_type: str,
         extra_args: List[str],
-        store_results: bool
+        store_results: bool,
+        write: bool = False
     ) -> Dict[str, Any]:
-        """Run linting with the specified configuration."""
-        timestamp = datetime.utcnow().isoformat()
-        result = {}
+        """Run linting with the specified configuration.
 
+        black only checks formatting, skipping its AST safety check, unless
+        write is set; ruff then also fixes what it can. The 'flake8' linter is
+        run with ruff, which implements the same checks natively and caches
+        its results.
+        """
+        timestamp = datetime.utcnow().isoformat()
+        black_args = [] if write else ['--check', '--fast']
+        ruff_args = ['--fix'] if write else []
+        jobs = []
         if lint_type in ('black', 'all'):
-            # Run black formatter
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"black src tests {' '.join(extra_args)}"
-            )
-            result['black'] = cmd_result.data
-
+            jobs.append(('black', [
+                'black', *black_args, '--workers', str(os.cpu_count() or 1),
+                'src', 'tests', *extra_args
+            ]))
         if lint_type in ('flake8', 'all'):
-            # Run flake8
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"flake8 src tests {' '.join(extra_args)}"
-            )
-            result['flake8'] = cmd_result.data
-
+            jobs.append(('flake8', [
+                'ruff', 'check', *ruff_args, 'src', 'tests', *extra_args
+            ]))
         if lint_type in ('mypy', 'all'):
-            # Run mypy
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"mypy src {' '.join(extra_args)}"
-            )
-            result['mypy'] = cmd_result.data
+            jobs.append(('mypy', [
+                'mypy', f"--cache-dir={self._mypy_cache_dir()}", '--sqlite-cache',
+                'src', *extra_args
+            ]))
+
+        # Reuse the last passing result of a linter run with the same command
+        # over the same files
+        tree_digest = self._lint_tree_digest()
+        cache_paths = {
+            name: self._lint_cache_path(tree_digest, name, cmd) for name, cmd in jobs
+        }
+        completed = {}
+        for name, _ in jobs:
+            cached = self._read_lint_cache(cache_paths[name])
+            if cached is not None and cached.get('returncode') == 0:
+                completed[name] = {**cached, 'cached': True}
+        pending = [(name, cmd) for name, cmd in jobs if name not in completed]
+
+        # The linters spend their time in subprocesses, so run them side by
+        # side and wait for the slowest instead of all three in turn
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    executor.submit(self.dev_tool, operation='shell', command=cmd): name
+                    for name, cmd in pending
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    completed[name] = output = future.result().data
+                    if output is not None and output.get('returncode') == 0:
+                        self._write_lint_cache(cache_paths[name], output)
+
+        # Keep results in the order the linters are listed
+        result = {name: completed[name] for name, _ in jobs}
 
         # Store results if requested
         if store_results and result:
-            self.memory_tool(
-                operation='store',
-                key=f"lint_results_{lint_type}_{timestamp}",
-                data=result,
-                tags=['lint', lint_type, timestamp[:10]]
+            self._store(
+                f"lint_results_{lint_type}_{timestamp}",
+                result,
+                ['lint', lint_type, timestamp[:10]]
             )
 
         return result
 
+    def _run_ci(
+        self,
+        test_type: str,
+        lint_type: str,
+        extra_args: List[str],
+        store_results: bool,
+        parallel: bool = True
+    ) -> Dict[str, Any]:
+        """Run tests and linting side by side, so CI takes as long as the
+        slower of the two rather than both."""
+        # Create the shared MemoryTool before both threads reach for it
+        if store_results:
+            self.memory_tool
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tests = executor.submit(
+                self._run_tests, test_type, extra_args, store_results, parallel
+            )
+            lint = executor.submit(self._run_linting, lint_type, [], store_results)
+            result = {'test': tests.result(), 'lint': lint.result()}
+
+        result['success'] = all(
+            isinstance(output, dict) and output.get('returncode') == 0
+            for outputs in result.values()
+            for name, output in outputs.items()
+            if name != 'coverage_report'
+        )
+        return result
+
+    def _lint_tree_digest(self) -> bytes:
+        """Digest the path, mtime and size of every file the linters read."""
+        digest = hashlib.blake2b(digest_size=16)
+
+        def add(path: Path):
+            st = path.stat()
+            digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+
+        for name in LINT_CONFIG_FILES:
+            path = self.workspace_root / name
+            if path.is_file():
+                add(path)
+        for name in LINT_PATHS:
+            for dirpath, dirnames, filenames in os.walk(self.workspace_root / name):
+                dirnames[:] = sorted(
+                    d for d in dirnames if d != '__pycache__' and not d.startswith('.')
+                )
+                for filename in sorted(filenames):
+                    if filename.endswith(('.py', '.pyi')):
+                        add(Path(dirpath) / filename)
+        return digest.digest()
+
+    def _lint_cache_path(self, tree_digest: bytes, name: str, command: List[str]) -> Path:
+        """Cache file for a linter command's result over a file tree."""
+        digest = hashlib.blake2b(tree_digest, digest_size=16)
+        digest.update('\0'.join(command).encode())
+        return self.workspace_root / LINT_CACHE_DIR / f"{name}-{digest.hexdigest()}.json"
+
+    @staticmethod
+    def _read_lint_cache(path: Path) -> Optional[Dict[str, Any]]:
+        """A cached linter result, or None if there is no usable one."""
+        try:
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_lint_cache(path: Path, output: Dict[str, Any]):
+        """Cache a linter's result, replacing its results for other trees."""
+        name = path.name.split('-', 1)[0]
+        path.parent.mkdir(exist_ok=True)
+        for stale in path.parent.glob(f"{name}-*.json"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(output))
+        os.replace(tmp_path, path)
+
+    def _mypy_cache_dir(self) -> Path:
+        """Cache directory for the current mypy configuration."""
+        digest = hashlib.blake2b(digest_size=4)
+        for name in MYPY_CONFIG_FILES:
+            path = self.workspace_root / name
+            if path.is_file():
+                digest.update(name.encode())
+                digest.update(path.read_bytes())
+        return self.workspace_root / f".mypy_cache_{digest.hexdigest()}"
+
     def _build_docs(
         self,
         doc_type: str,
@@ -280,10 +621,15 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
         result = {}
 
         if doc_type == 'sphinx':
-            # Build Sphinx documentation
+            # Build Sphinx documentation, reading sources on all cores.
+            # Doctrees are kept outside the HTML output so unchanged
+            # documents aren't re-read on the next build
             cmd_result = self.dev_tool(
                 operation='shell',
-                command=f"sphinx-build -b html docs/source docs/build/html {' '.join(extra_args)}"
+                command=[
+                    'sphinx-build', '-j', 'auto', '-d', 'docs/build/doctrees',
+                    '-b', 'html', 'docs/source', 'docs/build/html', *extra_args
+                ]
             )
             result['sphinx'] = cmd_result.data
 
@@ -296,7 +642,7 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
             # Build MkDocs documentation
             cmd_result = self.dev_tool(
                 operation='shell',
-                command=f"mkdocs build {' '.join(extra_args)}"
+                command=['mkdocs', 'build', *extra_args]
             )
             result['mkdocs'] = cmd_result.data
 
@@ -310,33 +656,57 @@ class AdvancedDeveloperTools(BaseCognitiveTool):
     def _container_ops(
         self,
         container_op: str,
-        extra_args: List[str]
+        extra_args: List[str],
+        targets: Optional[List[str]] = None,
+        cache_ref: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Perform container operations."""
-        result = {}
+        """Perform container operations.
 
-        if container_op == 'build':
-            # Build container
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"docker build -t mcp . {' '.join(extra_args)}"
+        Without targets the operation applies to the 'mcp' image. With
+        targets it applies to each image tag concurrently, and the result
+        maps each tag to its command output.
+
+        Builds use BuildKit and embed their layer cache in the image. Given
+        cache_ref, layers are reused from that image, so a build on a
+        machine with a cold cache only reruns the steps that changed.
+        """
+        if targets is None:
+            return {
+                container_op: self._container_op('mcp', container_op, extra_args, cache_ref)
+            }
+
+        # The work happens in docker, so threads are enough to overlap it.
+        # Leave two cores free for the calling process and the editor
+        workers = max(1, min(len(targets), (os.cpu_count() or 1) - 2))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outputs = executor.map(
+                lambda tag: self._container_op(tag, container_op, extra_args, cache_ref),
+                targets
             )
-            result['build'] = cmd_result.data
+            return {container_op: dict(zip(targets, outputs))}
 
+    def _container_op(
+        self,
+        tag: str,
+        container_op: str,
+        extra_args: List[str],
+        cache_ref: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Perform a container operation on one image."""
+        env = None
+        if container_op == 'build':
+            # Build container with BuildKit, embedding its layer cache
+            cache_args = ['--cache-from', cache_ref] if cache_ref else []
+            command = [
+                'docker', 'build', '--build-arg', 'BUILDKIT_INLINE_CACHE=1',
+                *cache_args, '-t', tag, '.', *extra_args
+            ]
+            env = {'DOCKER_BUILDKIT': '1'}
         elif container_op == 'test':
             # Run tests in container
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"docker run --rm mcp pytest {' '.join(extra_args)}"
-            )
-            result['test'] = cmd_result.data
-
-        elif container_op == 'run':
+            command = ['docker', 'run', '--rm', tag, 'pytest', *extra_args]
+        else:
             # Run container
-            cmd_result = self.dev_tool(
-                operation='shell',
-                command=f"docker run --rm mcp {' '.join(extra_args)}"
-            )
-            result['run'] = cmd_result.data
+            command = ['docker', 'run', '--rm', tag, *extra_args]
 
-        return result
\ No newline at end of file
+        return self.dev_tool(operation='shell', command=command, env=env).data
@@ -2,14 +2,73 @@
 Developer tools for MCP providing shell command execution, text editing, and testing capabilities.
 """
 
+import os
+import signal
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional, Union
 
 from anthropic.types.beta import BetaToolUnionParam
 
 from ..base import BaseCognitiveTool, CognitiveToolResult
 
+# Lines of stdout and stderr kept from a command; earlier lines are dropped
+MAX_OUTPUT_LINES = 10_000
+
+# Seconds a command may run before it is killed
+DEFAULT_TIMEOUT = 600
+
+
+def _drain(stream: IO[str], lines: deque, counter: list):
+    """Read a stream to EOF, keeping the most recent lines."""
+    with stream:
+        for line in stream:
+            lines.append(line)
+            counter[0] += 1
+
+
+# JSON schema of the tool's arguments
+_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["shell", "edit", "test"],
+            "description": "Operation to perform"
+        },
+        "command": {
+            "oneOf": [
+                {"type": "string"},
+                {"type": "array", "items": {"type": "string"}}
+            ],
+            "description": (
+                "Command to execute: a string is run by the shell, an "
+                "argument list is executed directly without a shell"
+            )
+        },
+        "timeout": {
+            "type": "number",
+            "description": "Seconds before the command is killed"
+        },
+        "file_path": {
+            "type": "string",
+            "description": "Path to file to edit"
+        },
+        "content": {
+            "type": "string",
+            "description": "New content for file"
+        },
+        "test_args": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Arguments for test execution"
+        }
+    },
+    "required": ["operation"]
+}
+
 
 class DeveloperTool(BaseCognitiveTool):
     """Tool for development operations including shell commands, text editing, and testing."""
@@ -30,7 +89,11 @@ class DeveloperTool(BaseCognitiveTool):
 
         Args:
             operation: The operation to perform ('shell', 'edit', 'test')
-            command: Shell command to execute (for 'shell' operation)
+            command: Shell command to execute (for 'shell' operation). An
+                argument list is executed directly, without a shell
+            timeout: Seconds before the command is killed (for 'shell' operation)
+            env: Environment variables to set for the command, on top of the
+                current environment (for 'shell' operation)
             file_path: Path to file to edit (for 'edit' operation)
             content: New content for file (for 'edit' operation)
             test_args: Arguments for test execution (for 'test' operation)
@@ -44,7 +107,11 @@ class DeveloperTool(BaseCognitiveTool):
         operation = kwargs.get('operation')
         try:
             if operation == 'shell':
-                result = self._execute_shell(kwargs['command'])
+                result = self._execute_shell(
+                    kwargs['command'],
+                    kwargs.get('timeout', DEFAULT_TIMEOUT),
+                    kwargs.get('env')
+                )
             elif operation == 'edit':
                 result = self._edit_file(kwargs['file_path'], kwargs['content'])
             elif operation == 'test':
@@ -72,34 +139,7 @@ class DeveloperTool(BaseCognitiveTool):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["shell", "edit", "test"],
-                            "description": "Operation to perform"
-                        },
-                        "command": {
-                            "type": "string",
-                            "description": "Shell command to execute"
-                        },
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to file to edit"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "New content for file"
-                        },
-                        "test_args": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Arguments for test execution"
-                        }
-                    },
-                    "required": ["operation"]
-                }
+                "parameters": _PARAMETERS
             }
         }
 
@@ -116,24 +156,88 @@ class DeveloperTool(BaseCognitiveTool):
 
         return True
 
-    def _execute_shell(self, command: str) -> dict[str, Any]:
-        """Execute a shell command."""
+    def _execute_shell(
+        self,
+        command: Union[str, list[str]],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        env: Optional[dict[str, str]] = None
+    ) -> dict[str, Any]:
+        """Execute a shell command.
+
+        A string is run by the shell; an argument list is executed directly,
+        saving the shell process and any quoting issues.
+
+        Output is read as it is produced and only the last MAX_OUTPUT_LINES
+        lines of each stream are kept, so memory stays bounded however much a
+        command prints. 'truncated' is set when lines were dropped.
+
+        A command still running after timeout seconds is killed along with
+        its children, and the result has 'timed_out' set and an 'error'.
+
+        env adds to or overrides the current environment for the command.
+        """
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command,
-                shell=True,
-                capture_output=True,
+                shell=isinstance(command, str),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                cwd=self.workspace_root
+                # Undecodable output must not kill the reader threads
+                errors='replace',
+                bufsize=1,
+                cwd=self.workspace_root,
+                env={**os.environ, **env} if env else None,
+                # Own process group, so a timeout can kill the whole tree
+                start_new_session=True
             )
-            return {
-                'returncode': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr
-            }
-        except subprocess.SubprocessError as e:
+        except (OSError, subprocess.SubprocessError) as e:
             raise RuntimeError(f"Shell command failed: {str(e)}")
 
+        stdout: deque = deque(maxlen=MAX_OUTPUT_LINES)
+        stderr: deque = deque(maxlen=MAX_OUTPUT_LINES)
+        counts = [0], [0]
+        readers = [
+            threading.Thread(target=_drain, args=args, daemon=True)
+            for args in (
+                (proc.stdout, stdout, counts[0]),
+                (proc.stderr, stderr, counts[1])
+            )
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            self._kill(proc)
+            returncode = proc.wait()
+            timed_out = True
+        for reader in readers:
+            reader.join()
+
+        result = {
+            'returncode': returncode,
+            'stdout': ''.join(stdout),
+            'stderr': ''.join(stderr),
+            'truncated': counts[0][0] > len(stdout) or counts[1][0] > len(stderr),
+            'timed_out': timed_out
+        }
+        if timed_out:
+            result['error'] = f"Command timed out after {timeout} seconds"
+        return result
+
+    @staticmethod
+    def _kill(proc: subprocess.Popen):
+        """Kill a process and the rest of its process group."""
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+                return
+            except ProcessLookupError:
+                pass
+        proc.kill()
+
     def _edit_file(self, file_path: str, content: str) -> dict[str, Any]:
         """Edit a file with new content."""
         try:
@@ -149,5 +253,4 @@ class DeveloperTool(BaseCognitiveTool):
 
     def _run_tests(self, test_args: list[str]) -> dict[str, Any]:
         """Run tests with specified arguments."""
-        command = ['pytest'] + test_args
-        return self._execute_shell(' '.join(command))
\ No newline at end of file
+        return self._execute_shell(['pytest', *test_args])
\ No newline at end of file
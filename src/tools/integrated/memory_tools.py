@@ -2,16 +2,138 @@
 Memory tools for MCP providing data persistence and retrieval capabilities.
 """
 
-import json
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, Set
+from typing import Any, Iterator, Optional, Set
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
 
+import orjson
 from anthropic.types.beta import BetaToolUnionParam
 
 from ..base import BaseCognitiveTool, CognitiveToolResult
 
+# SQL is kept in constants so each statement text is identical between calls
+# and hits sqlite3's prepared statement cache
+
+_CREATE_MEMORY = """
+    CREATE TABLE IF NOT EXISTS memory (
+        key TEXT PRIMARY KEY,
+        data TEXT,
+        created_at INTEGER,
+        updated_at INTEGER
+    )
+"""
+
+_CREATE_TAGS = """
+    CREATE TABLE IF NOT EXISTS tags (
+        key TEXT,
+        tag TEXT,
+        FOREIGN KEY(key) REFERENCES memory(key) ON DELETE CASCADE,
+        PRIMARY KEY(key, tag)
+    )
+"""
+
+# Covers the tag filter in _list_data, which looks keys up by tag
+_CREATE_TAGS_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_tags_tag_key ON tags(tag, key)
+"""
+
+_UPSERT_ENTRY = """
+    INSERT INTO memory (key, data, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        data = excluded.data,
+        updated_at = excluded.updated_at
+"""
+
+_DELETE_TAGS = "DELETE FROM tags WHERE key = ?"
+
+# Tags of a key other than those being kept; formatted with the placeholders
+_DELETE_OTHER_TAGS = "DELETE FROM tags WHERE key = ? AND tag NOT IN ({})"
+
+_INSERT_TAG = "INSERT OR IGNORE INTO tags (key, tag) VALUES (?, ?)"
+
+_DELETE_ENTRY = "DELETE FROM memory WHERE key = ?"
+
+_SELECT_ENTRIES = """
+    SELECT m.key, m.data, m.created_at, m.updated_at, t.tag
+    FROM memory m
+    LEFT JOIN tags t ON t.key = m.key
+"""
+
+_SELECT_ENTRY = _SELECT_ENTRIES + "WHERE m.key = ?"
+
+# Entries having all of a set of tags; formatted with the tag placeholders
+_SELECT_TAGGED_ENTRIES = _SELECT_ENTRIES + """
+    WHERE m.key IN (
+        SELECT key
+        FROM tags
+        WHERE tag IN ({})
+        GROUP BY key
+        HAVING COUNT(DISTINCT tag) = ?
+    )
+"""
+
+# SQLite page cache size; negative values are in KiB
+PAGE_CACHE_KIB = 20_000
+
+
+def _isoformat(timestamp: Any) -> Any:
+    """Format a stored nanosecond timestamp as ISO 8601 UTC. Databases
+    written before timestamps were integers hold ISO strings already."""
+    if isinstance(timestamp, int):
+        return datetime.fromtimestamp(timestamp / 1e9, timezone.utc).isoformat()
+    return timestamp
+
+
+def _placeholder_count(n: int) -> int:
+    """Round a tag count up to a power of two, so tag filters of any size
+    share a handful of cached statements."""
+    return 1 << (n - 1).bit_length()
+
+
+# JSON schema of the tool's arguments
+_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["store", "store_bulk", "retrieve", "list", "delete"],
+            "description": "Operation to perform"
+        },
+        "key": {
+            "type": "string",
+            "description": "Key for the data"
+        },
+        "data": {
+            "type": "object",
+            "description": "Data to store"
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Tags for the data"
+        },
+        "entries": {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "description": "[key, data, tags]"
+            },
+            "description": "Entries to store together"
+        },
+        "tag_filter": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Tags to filter by"
+        }
+    },
+    "required": ["operation"]
+}
+
 
 class MemoryTool(BaseCognitiveTool):
     """Tool for memory operations including data persistence and retrieval."""
@@ -28,16 +150,52 @@ class MemoryTool(BaseCognitiveTool):
         self.storage_dir = storage_dir or Path.home() / '.mcp' / 'memory'
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.storage_dir / 'memory.db'
+        self._lock = threading.Lock()
         self._init_db()
 
+    def __enter__(self) -> "MemoryTool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection for one transaction, committing on success
+        and rolling back on error.
+
+        The write lock is taken when the transaction begins, so it can't
+        fail halfway through on a lock held by another connection.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, query: str, params=()) -> list[tuple]:
+        """Run a read query and fetch all its rows."""
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
     def __call__(self, **kwargs) -> CognitiveToolResult:
         """Execute a memory operation.
 
         Args:
-            operation: The operation to perform ('store', 'retrieve', 'list', 'delete')
+            operation: The operation to perform ('store', 'store_bulk', 'retrieve',
+                'list', 'delete')
             key: Key for the data
             data: Data to store (for 'store' operation)
             tags: List of tags for the data (for 'store' operation)
+            entries: (key, data, tags) entries to store in one transaction
+                (for 'store_bulk' operation)
             tag_filter: List of tags to filter by (for 'list' operation)
         """
         if not self.validate_args(**kwargs):
@@ -54,6 +212,10 @@ class MemoryTool(BaseCognitiveTool):
                     kwargs['data'],
                     kwargs.get('tags', [])
                 )
+            elif operation == 'store_bulk':
+                result = self.batch_store([
+                    (key, data, tags) for key, data, tags in kwargs['entries']
+                ])
             elif operation == 'retrieve':
                 result = self._retrieve_data(kwargs['key'])
             elif operation == 'list':
@@ -83,35 +245,7 @@ class MemoryTool(BaseCognitiveTool):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["store", "retrieve", "list", "delete"],
-                            "description": "Operation to perform"
-                        },
-                        "key": {
-                            "type": "string",
-                            "description": "Key for the data"
-                        },
-                        "data": {
-                            "type": "object",
-                            "description": "Data to store"
-                        },
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Tags for the data"
-                        },
-                        "tag_filter": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Tags to filter by"
-                        }
-                    },
-                    "required": ["operation"]
-                }
+                "parameters": _PARAMETERS
             }
         }
 
@@ -123,151 +257,153 @@ class MemoryTool(BaseCognitiveTool):
         operation = kwargs['operation']
         if operation == 'store' and ('key' not in kwargs or 'data' not in kwargs):
             return False
+        elif operation == 'store_bulk' and 'entries' not in kwargs:
+            return False
         elif operation in ('retrieve', 'delete') and 'key' not in kwargs:
             return False
 
         return True
 
     def _init_db(self):
-        """Initialize the SQLite database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS memory (
-                    key TEXT PRIMARY KEY,
-                    data TEXT,
-                    created_at TIMESTAMP,
-                    updated_at TIMESTAMP
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tags (
-                    key TEXT,
-                    tag TEXT,
-                    FOREIGN KEY(key) REFERENCES memory(key) ON DELETE CASCADE,
-                    PRIMARY KEY(key, tag)
-                )
-            """)
-            conn.commit()
+        """Open the SQLite database and create its tables.
+
+        The connection stays open for the life of the tool and is shared
+        between threads; every use holds self._lock. It runs in autocommit
+        mode, with writes grouped by _transaction.
+        """
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        # WAL lets other connections read while this one writes, and
+        # synchronous=NORMAL only syncs at checkpoints in WAL mode
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute(f"PRAGMA cache_size=-{PAGE_CACHE_KIB}")
+
+        with self._transaction() as conn:
+            conn.execute(_CREATE_MEMORY)
+            conn.execute(_CREATE_TAGS)
+            conn.execute(_CREATE_TAGS_INDEX)
 
     def _store_data(self, key: str, data: Any, tags: list[str]) -> dict[str, Any]:
         """Store data with tags."""
-        now = datetime.utcnow().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            # Store or update the data
-            conn.execute("""
-                INSERT INTO memory (key, data, created_at, updated_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                    data = excluded.data,
-                    updated_at = excluded.updated_at
-            """, (key, json.dumps(data), now, now))
-
-            # Update tags
-            conn.execute("DELETE FROM tags WHERE key = ?", (key,))
-            conn.executemany(
-                "INSERT INTO tags (key, tag) VALUES (?, ?)",
-                [(key, tag) for tag in set(tags)]
-            )
-            conn.commit()
+        # Encode before taking the lock, so a large payload doesn't hold up
+        # other threads using the database
+        encoded = self._encode(data)
+        now = time.time_ns()
+        with self._transaction() as conn:
+            self._write_entry(conn, key, encoded, tags, now)
 
         return {
             'key': key,
             'tags': tags,
-            'timestamp': now
+            'timestamp': _isoformat(now)
         }
 
+    def batch_store(self, entries: list[tuple[str, Any, list[str]]]) -> list[dict[str, Any]]:
+        """Store several entries in a single transaction.
+
+        Args:
+            entries: (key, data, tags) tuples to store
+        """
+        encoded = [self._encode(data) for _, data, _ in entries]
+        now = time.time_ns()
+        with self._transaction() as conn:
+            for (key, _, tags), data in zip(entries, encoded):
+                self._write_entry(conn, key, data, tags, now)
+        timestamp = _isoformat(now)
+
+        # Refresh planner statistics if the batch changed the tables enough
+        # to need it
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+
+        return [
+            {'key': key, 'tags': tags, 'timestamp': timestamp}
+            for key, _, tags in entries
+        ]
+
+    def _write_entry(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        data: str,
+        tags: list[str],
+        now: int
+    ):
+        """Write an entry and its tags within an open transaction.
+
+        data is the entry's encoded JSON. now is a time.time_ns() reading; timestamps are stored as integer
+        nanoseconds and formatted only when entries are returned.
+        """
+        # Store or update the data
+        conn.execute(_UPSERT_ENTRY, (key, data, now, now))
+
+        # Update tags, leaving those the entry already has in place
+        tags = sorted(set(tags))
+        if not tags:
+            conn.execute(_DELETE_TAGS, (key,))
+            return
+        count = _placeholder_count(len(tags))
+        conn.execute(
+            _DELETE_OTHER_TAGS.format(','.join('?' * count)),
+            (key, *tags, *[tags[-1]] * (count - len(tags)))
+        )
+        conn.executemany(_INSERT_TAG, [(key, tag) for tag in tags])
+
+    @staticmethod
+    def _encode(data: Any) -> str:
+        """Encode data as JSON text, accepting the non-string keys the
+        json module used to."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
     def _retrieve_data(self, key: str) -> dict[str, Any]:
         """Retrieve data and its tags."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Get the data
-            row = conn.execute(
-                "SELECT data, created_at, updated_at FROM memory WHERE key = ?",
-                (key,)
-            ).fetchone()
-
-            if not row:
-                return None
-
-            # Get the tags
-            tags = [
-                tag[0] for tag in conn.execute(
-                    "SELECT tag FROM tags WHERE key = ?",
-                    (key,)
-                ).fetchall()
-            ]
-
-            return {
-                'key': key,
-                'data': json.loads(row[0]),
-                'created_at': row[1],
-                'updated_at': row[2],
-                'tags': tags
-            }
+        entries = self._collect_entries(self._query(_SELECT_ENTRY, (key,)))
+
+        return entries[0] if entries else None
 
     def _list_data(self, tag_filter: list[str]) -> list[dict[str, Any]]:
         """List all data entries, optionally filtered by tags."""
-        with sqlite3.connect(self.db_path) as conn:
-            if tag_filter:
-                # Get keys that have all the specified tags
-                keys = conn.execute("""
-                    SELECT key
-                    FROM tags
-                    WHERE tag IN ({})
-                    GROUP BY key
-                    HAVING COUNT(DISTINCT tag) = ?
-                """.format(','.join('?' * len(tag_filter))),
-                    (*tag_filter, len(tag_filter))
-                ).fetchall()
-                keys = [k[0] for k in keys]
-
-                if not keys:
-                    return []
-
-                # Get data for these keys
-                query = """
-                    SELECT m.key, m.data, m.created_at, m.updated_at
-                    FROM memory m
-                    WHERE m.key IN ({})
-                """.format(','.join('?' * len(keys)))
-                params = keys
-            else:
-                query = "SELECT key, data, created_at, updated_at FROM memory"
-                params = []
-
-            entries = []
-            for row in conn.execute(query, params).fetchall():
-                # Get tags for each entry
-                tags = [
-                    tag[0] for tag in conn.execute(
-                        "SELECT tag FROM tags WHERE key = ?",
-                        (row[0],)
-                    ).fetchall()
-                ]
-
-                entries.append({
-                    'key': row[0],
-                    'data': json.loads(row[1]),
-                    'created_at': row[2],
-                    'updated_at': row[3],
-                    'tags': tags
-                })
-
-            return entries
+        if not tag_filter:
+            return self._collect_entries(self._query(_SELECT_ENTRIES))
+
+        # Select entries that have all the specified tags in one pass. The
+        # placeholders are padded by repeating a tag, which leaves the
+        # matches unchanged
+        tags = sorted(set(tag_filter))
+        count = _placeholder_count(len(tags))
+        query = _SELECT_TAGGED_ENTRIES.format(','.join('?' * count))
+        params = (*tags, *[tags[-1]] * (count - len(tags)), len(tags))
+        return self._collect_entries(self._query(query, params))
+
+    @staticmethod
+    def _collect_entries(rows) -> list[dict[str, Any]]:
+        """Group (key, data, created_at, updated_at, tag) rows into entries,
+        one per key, in the order keys first appear."""
+        entries: dict[str, dict[str, Any]] = {}
+        for key, data, created_at, updated_at, tag in rows:
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = {
+                    'key': key,
+                    'data': orjson.loads(data),
+                    'created_at': _isoformat(created_at),
+                    'updated_at': _isoformat(updated_at),
+                    'tags': []
+                }
+            if tag is not None:
+                entry['tags'].append(tag)
+
+        return list(entries.values())
 
     def _delete_data(self, key: str) -> dict[str, Any]:
         """Delete data and its tags."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Check if the key exists
-            row = conn.execute(
-                "SELECT 1 FROM memory WHERE key = ?",
-                (key,)
-            ).fetchone()
-
-            if not row:
-                return {'deleted': False, 'key': key}
-
+        with self._transaction() as conn:
             # Delete the data (tags will be cascade deleted)
-            conn.execute("DELETE FROM memory WHERE key = ?", (key,))
-            conn.commit()
+            deleted = conn.execute(_DELETE_ENTRY, (key,)).rowcount
 
-            return {'deleted': True, 'key': key}
\ No newline at end of file
+        return {'deleted': deleted > 0, 'key': key}
@@ -2,18 +2,261 @@
 Computer control tools for MCP providing system automation and web interaction capabilities.
 """
 
-import json
+import functools
+import hashlib
+import mmap
 import os
 import platform
+import queue
+import re
+import select
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+from urllib.parse import urlencode
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
 
 from anthropic.types.beta import BetaToolUnionParam
 
 from ..base import BaseCognitiveTool, CognitiveToolResult
 
+# numpy arrays and naive datetimes are common in cached results
+_DUMPS_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode cached data as JSON."""
+    return orjson.dumps(data, option=_DUMPS_OPTIONS)
+
+
+_loads = orjson.loads
+
+# Fetched bodies larger than this are returned as the path of the cached
+# body instead of inline
+MAX_INLINE_BYTES = 1 << 20
+
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Cache files at least this large are parsed from a memory map rather than
+# read into a bytes copy first
+MMAP_MIN_BYTES = mmap.PAGESIZE
+
+# Shared so repeated requests to a host reuse its connection. Connection
+# failures and 5xx responses to GETs are retried twice with backoff
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+SEARCH_URL = "https://api.duckduckgo.com/"
+
+# (connect, read) timeouts in seconds
+HTTP_TIMEOUT = (3.05, 10)
+
+# Headers of a 304 response that replace those of the cached response
+_REVALIDATED_HEADERS = ('Cache-Control', 'Date', 'ETag', 'Expires', 'Last-Modified')
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+def _expires(headers: Mapping[str, str]) -> float:
+    """Time until which a response may be used without revalidating."""
+    cache_control = headers.get('Cache-Control', '')
+    match = _MAX_AGE.search(cache_control)
+    if match is None or 'no-cache' in cache_control:
+        return 0.0
+    return time.time() + int(match.group(1))
+
+
+@functools.lru_cache(maxsize=1)
+def _has_osascript() -> bool:
+    """Whether this is macOS with osascript on the PATH."""
+    return platform.system().lower() == 'darwin' and shutil.which('osascript') is not None
+
+
+# Scripts sent to the osascript coprocess are wrapped to log their outcome to
+# stderr between these markers, since its stdout only echoes results
+_OSA_RESULT = '__MCP_RESULT__'
+_OSA_ERROR = '__MCP_ERROR__'
+_OSA_END = b'__MCP_END__\n'
+_OSA_WRAPPER = """\
+try
+    set mcpResult to run script {script}
+on error mcpMessage number mcpNumber
+    if mcpNumber is not -2763 then
+        log "__MCP_ERROR__"
+        log "execution error: " & mcpMessage & " (" & mcpNumber & ")"
+        log "__MCP_END__"
+        return
+    end if
+end try
+log "__MCP_RESULT__"
+try
+    log (mcpResult as text)
+end try
+log "__MCP_END__"
+"""
+
+# Seconds to wait for the osascript coprocess to finish a script
+APPLESCRIPT_TIMEOUT = 600
+
+
+def _applescript_literal(text: str) -> str:
+    """Quote text as an AppleScript string literal on a single line."""
+    escaped = (
+        text.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+        .replace('\t', '\\t')
+    )
+    return f'"{escaped}"'
+
+
+def _parse_osa_output(output: bytes) -> dict[str, Any]:
+    """Split what the coprocess logged for a wrapped script into a result."""
+    text = '\n' + output.decode('utf-8', errors='replace')
+    for marker, returncode in ((_OSA_RESULT, 0), (_OSA_ERROR, 1)):
+        logged, found, value = text.rpartition(f'\n{marker}\n')
+        if found:
+            break
+    else:
+        raise ValueError("osascript output has no result marker")
+
+    stderr = f'{logged[1:]}\n' if logged else ''
+    if returncode:
+        return {'returncode': 1, 'stdout': '', 'stderr': stderr + value}
+    return {'returncode': 0, 'stdout': value, 'stderr': stderr}
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Replace a file's contents so readers never see a partial write."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Cache files are fsynced in batches by a background thread, so a burst of
+# writes shares fsyncs instead of each waiting on its own. A batch is synced
+# once FSYNC_BATCH files are queued or FSYNC_INTERVAL seconds have passed
+FSYNC_INTERVAL = 0.05
+FSYNC_BATCH = 64
+
+_FSYNC_QUEUE: "queue.Queue[Path]" = queue.Queue()
+_FSYNC_LOCK = threading.Lock()
+_fsync_thread: Optional[threading.Thread] = None
+
+
+def _queue_fsync(path: Path):
+    """Queue a written file to be fsynced by the background thread."""
+    global _fsync_thread
+    with _FSYNC_LOCK:
+        if _fsync_thread is None:
+            _fsync_thread = threading.Thread(
+                target=_fsync_worker,
+                name='cache-fsync',
+                daemon=True
+            )
+            _fsync_thread.start()
+    _FSYNC_QUEUE.put(path)
+
+
+def _fsync_worker():
+    """Fsync queued files, and their directories, in batches."""
+    while True:
+        paths = [_FSYNC_QUEUE.get()]
+        deadline = time.monotonic() + FSYNC_INTERVAL
+        while len(paths) < FSYNC_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                paths.append(_FSYNC_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            unique = set(paths)
+            # Syncing the directories makes the renames durable too
+            for path in unique | {path.parent for path in unique}:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.fsync(fd)
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+        finally:
+            for _ in paths:
+                _FSYNC_QUEUE.task_done()
+
+
+# Default of _cache's cache_data, distinguishing a read from writing None
+_NO_CACHE_DATA = object()
+
+# Arguments each operation requires
+_REQUIRED_ARGS = {
+    'applescript': frozenset({'script'}),
+    'web_search': frozenset({'query'}),
+    'web_fetch': frozenset({'url'}),
+    'cache': frozenset({'cache_key'})
+}
+
+# JSON schema of the tool's arguments
+_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["applescript", "web_search", "web_fetch", "cache"],
+            "description": "Operation to perform"
+        },
+        "script": {
+            "type": "string",
+            "description": "AppleScript to execute"
+        },
+        "query": {
+            "type": "string",
+            "description": "Search query for web search"
+        },
+        "url": {
+            "type": "string",
+            "description": "URL to fetch"
+        },
+        "cache_key": {
+            "type": "string",
+            "description": "Key for cache operations"
+        },
+        "cache_data": {
+            "type": "object",
+            "description": "Data to cache"
+        }
+    },
+    "required": ["operation"]
+}
+
 
 class ComputerControlTool(BaseCognitiveTool):
     """Tool for computer control operations including system automation and web interactions."""
@@ -28,9 +271,37 @@ class ComputerControlTool(BaseCognitiveTool):
             cache_dir: Directory for caching web results. Defaults to ~/.mcp/cache
         """
         self.cache_dir = cache_dir or Path.home() / '.mcp' / 'cache'
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.http_cache_dir = self.cache_dir / 'http'
+        self.http_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._osa_proc = None
+        self._osa_failed = False
+        self._osa_lock = threading.Lock()
         self._setup_platform()
 
+        # Handler of each operation and the arguments passed on to it
+        self._dispatch = {
+            'applescript': (self._run_applescript, ('script',)),
+            'web_search': (self._web_search, ('query',)),
+            'web_fetch': (self._web_fetch, ('url',)),
+            'cache': (self._cache, ('cache_key', 'cache_data'))
+        }
+
+    def __del__(self):
+        self.close()
+
+    def flush(self):
+        """Wait until cache files written so far have been fsynced."""
+        _FSYNC_QUEUE.join()
+
+    def close(self):
+        """Stop the AppleScript coprocess, if one is running."""
+        proc, self._osa_proc = getattr(self, '_osa_proc', None), None
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+            proc.stdin.close()
+            proc.stderr.close()
+
     def __call__(self, **kwargs) -> CognitiveToolResult:
         """Execute a computer control operation.
 
@@ -48,25 +319,11 @@ class ComputerControlTool(BaseCognitiveTool):
                 error="Invalid arguments provided"
             )
 
-        operation = kwargs.get('operation')
+        handler, arg_names = self._dispatch[kwargs['operation']]
         try:
-            if operation == 'applescript' and self.is_macos:
-                result = self._run_applescript(kwargs['script'])
-            elif operation == 'web_search':
-                result = self._web_search(kwargs['query'])
-            elif operation == 'web_fetch':
-                result = self._web_fetch(kwargs['url'])
-            elif operation == 'cache':
-                if 'cache_data' in kwargs:
-                    result = self._cache_write(kwargs['cache_key'], kwargs['cache_data'])
-                else:
-                    result = self._cache_read(kwargs['cache_key'])
-            else:
-                return CognitiveToolResult(
-                    success=False,
-                    error=f"Unknown or unsupported operation: {operation}"
-                )
-
+            result = handler(**{
+                name: kwargs[name] for name in arg_names if name in kwargs
+            })
             return CognitiveToolResult(
                 success=True,
                 data=result
@@ -84,74 +341,56 @@ class ComputerControlTool(BaseCognitiveTool):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["applescript", "web_search", "web_fetch", "cache"],
-                            "description": "Operation to perform"
-                        },
-                        "script": {
-                            "type": "string",
-                            "description": "AppleScript to execute"
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "Search query for web search"
-                        },
-                        "url": {
-                            "type": "string",
-                            "description": "URL to fetch"
-                        },
-                        "cache_key": {
-                            "type": "string",
-                            "description": "Key for cache operations"
-                        },
-                        "cache_data": {
-                            "type": "object",
-                            "description": "Data to cache"
-                        }
-                    },
-                    "required": ["operation"]
-                }
+                "parameters": _PARAMETERS
             }
         }
 
     def validate_args(self, **kwargs) -> bool:
         """Validate the arguments for this tool."""
-        if 'operation' not in kwargs:
-            return False
-
-        operation = kwargs['operation']
-        if operation == 'applescript' and not self.is_macos:
-            return False
-        elif operation == 'applescript' and 'script' not in kwargs:
-            return False
-        elif operation == 'web_search' and 'query' not in kwargs:
-            return False
-        elif operation == 'web_fetch' and 'url' not in kwargs:
-            return False
-        elif operation == 'cache' and 'cache_key' not in kwargs:
+        operation = kwargs.get('operation')
+        required = _REQUIRED_ARGS.get(operation)
+        if required is None or not required.issubset(kwargs):
             return False
 
-        return True
+        return operation != 'applescript' or self.is_macos
 
     def _setup_platform(self):
         """Setup platform-specific configurations."""
-        self.is_macos = platform.system().lower() == 'darwin'
-        if self.is_macos:
-            # Verify osascript is available
-            try:
-                subprocess.run(['which', 'osascript'], check=True, capture_output=True)
-            except subprocess.SubprocessError:
-                self.is_macos = False
+        # AppleScript support needs osascript, looked up once per process
+        self.is_macos = _has_osascript()
 
     def _run_applescript(self, script: str) -> dict[str, Any]:
-        """Execute an AppleScript."""
+        """Execute an AppleScript.
+
+        Scripts are sent to a long-running `osascript -i` so each call doesn't
+        start a new osascript. If the coprocess can't be started or has died,
+        the script runs in a one-off osascript instead. If it stops responding
+        mid-script, the call fails and later calls use one-off processes.
+        """
         if not self.is_macos:
             raise RuntimeError("AppleScript is only supported on macOS")
 
+        command = _applescript_literal(_OSA_WRAPPER.format(
+            script=_applescript_literal(script)
+        ))
+        with self._osa_lock:
+            proc = self._osa_coprocess()
+            if proc is not None:
+                try:
+                    proc.stdin.write(f'run script {command}\n'.encode())
+                    proc.stdin.flush()
+                except OSError:
+                    # The script was never sent, so it is safe to run it again
+                    self.close()
+                    proc = None
+            if proc is not None:
+                try:
+                    return _parse_osa_output(self._osa_read(proc))
+                except (EOFError, TimeoutError, ValueError) as e:
+                    self._osa_failed = True
+                    self.close()
+                    raise RuntimeError(f"AppleScript execution failed: {e!r}")
+
         try:
             result = subprocess.run(
                 ['osascript', '-e', script],
@@ -166,35 +405,176 @@ class ComputerControlTool(BaseCognitiveTool):
         except subprocess.SubprocessError as e:
             raise RuntimeError(f"AppleScript execution failed: {str(e)}")
 
+    def _osa_coprocess(self) -> Optional[subprocess.Popen]:
+        """The osascript coprocess, started if needed, or None if it can't be
+        used. Must be called holding _osa_lock."""
+        if self._osa_proc is not None and self._osa_proc.poll() is not None:
+            self.close()
+        if self._osa_proc is None and not self._osa_failed:
+            try:
+                self._osa_proc = subprocess.Popen(
+                    ['osascript', '-i'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+            except OSError:
+                self._osa_failed = True
+        return self._osa_proc
+
+    @staticmethod
+    def _osa_read(proc: subprocess.Popen) -> bytes:
+        """Read the coprocess's stderr up to the end marker of a script."""
+        fd = proc.stderr.fileno()
+        output = bytearray()
+        deadline = time.monotonic() + APPLESCRIPT_TIMEOUT
+        while not output.endswith(_OSA_END):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("osascript coprocess timed out")
+            chunk = os.read(fd, 64 * 1024)
+            if not chunk:
+                raise EOFError("osascript coprocess exited")
+            output += chunk
+        return bytes(output[:-len(_OSA_END)])
+
     def _web_search(self, query: str) -> dict[str, Any]:
         """Perform a web search using DuckDuckGo."""
-        url = f"https://api.duckduckgo.com/?q={query}&format=json"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-
-    def _web_fetch(self, url: str) -> dict[str, Any]:
-        """Fetch content from a URL."""
-        response = requests.get(url)
-        response.raise_for_status()
-        return {
-            'status_code': response.status_code,
-            'headers': dict(response.headers),
-            'content': response.text
+        url = f"{SEARCH_URL}?{urlencode({'q': query, 'format': 'json'})}"
+        _, _, body_path = self._http_get_cached(url)
+        return _loads(body_path.read_bytes())
+
+    def _web_fetch(self, url: str, max_inline_bytes: int = MAX_INLINE_BYTES) -> dict[str, Any]:
+        """Fetch content from a URL.
+
+        A body up to max_inline_bytes is decoded and returned as 'content',
+        or parsed and returned as 'json' if it is application/json. A larger
+        one is returned as 'content_path', the cached body file, and
+        'size', so it is never held in memory whole.
+        """
+        status_code, headers, body_path = self._http_get_cached(url)
+        result = {
+            'status_code': status_code,
+            'headers': headers
         }
 
+        size = body_path.stat().st_size
+        if size > max_inline_bytes:
+            result['content_path'] = str(body_path)
+            result['size'] = size
+            return result
+
+        headers = CaseInsensitiveDict(headers)
+        body = body_path.read_bytes()
+        if headers.get('Content-Type', '').startswith('application/json'):
+            # Parse the bytes directly rather than decoding them first
+            try:
+                result['json'] = _loads(body)
+                return result
+            except orjson.JSONDecodeError:
+                pass
+
+        encoding = requests.utils.get_encoding_from_headers(headers)
+        result['content'] = body.decode(encoding or 'utf-8', errors='replace')
+        return result
+
+    def _http_get_cached(self, url: str) -> tuple[int, dict[str, str], Path]:
+        """GET a URL through the HTTP cache in http_cache_dir.
+
+        A cached response is reused without a request until its max-age
+        runs out, then revalidated with If-None-Match/If-Modified-Since; a
+        304 reuses the cached body. Bodies are streamed to disk in chunks.
+
+        Returns:
+            The status code, headers and path of the body file
+        """
+        key = hashlib.sha1(url.encode()).hexdigest()
+        meta_path = self.http_cache_dir / f"{key}.meta.json"
+        body_path = self.http_cache_dir / f"{key}.body"
+
+        try:
+            meta = _loads(meta_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            meta = None
+        if meta is not None and not body_path.exists():
+            meta = None
+
+        if meta is not None and meta['expires'] > time.time():
+            return meta['status_code'], meta['headers'], body_path
+
+        conditional = {}
+        if meta is not None:
+            cached_headers = CaseInsensitiveDict(meta['headers'])
+            if cached_headers.get('ETag'):
+                conditional['If-None-Match'] = cached_headers['ETag']
+            if cached_headers.get('Last-Modified'):
+                conditional['If-Modified-Since'] = cached_headers['Last-Modified']
+
+        with _SESSION.get(url, headers=conditional, stream=True, timeout=HTTP_TIMEOUT) as response:
+            if response.status_code == 304 and meta is not None:
+                cached_headers.update({
+                    name: response.headers[name]
+                    for name in _REVALIDATED_HEADERS
+                    if name in response.headers
+                })
+                meta['headers'] = dict(cached_headers)
+                meta['expires'] = _expires(response.headers)
+                _write_atomic(meta_path, _dumps(meta))
+                return meta['status_code'], meta['headers'], body_path
+
+            response.raise_for_status()
+            fd, tmp_path = tempfile.mkstemp(dir=self.http_cache_dir, prefix=f".{key}.")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(tmp_path, body_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            meta = {
+                'status_code': response.status_code,
+                'headers': dict(response.headers),
+                'expires': _expires(response.headers)
+            }
+
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            meta_path.unlink(missing_ok=True)
+        else:
+            _write_atomic(meta_path, _dumps(meta))
+        return meta['status_code'], meta['headers'], body_path
+
+    def _cache(self, cache_key: str, cache_data: Any = _NO_CACHE_DATA) -> Any:
+        """Write cache_data to the cache if given, otherwise read the entry."""
+        if cache_data is _NO_CACHE_DATA:
+            return self._cache_read(cache_key)
+        return self._cache_write(cache_key, cache_data)
+
     def _cache_write(self, key: str, data: Any) -> dict[str, Any]:
-        """Write data to cache."""
+        """Write data to cache.
+
+        The file is replaced atomically and fsynced in the background; call
+        flush to wait for that.
+        """
         cache_file = self.cache_dir / f"{key}.json"
-        cache_file.write_text(json.dumps(data))
+        payload = _dumps(data)
+        _write_atomic(cache_file, payload)
+        _queue_fsync(cache_file)
         return {
             'path': str(cache_file),
-            'size': cache_file.stat().st_size
+            'size': len(payload)
         }
 
     def _cache_read(self, key: str) -> Any:
         """Read data from cache."""
         cache_file = self.cache_dir / f"{key}.json"
-        if not cache_file.exists():
-            return None
-        return json.loads(cache_file.read_text())
\ No newline at end of file
+        try:
+            with open(cache_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                    return _loads(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    return _loads(view)
+        except FileNotFoundError:
+            return None
\ No newline at end of file
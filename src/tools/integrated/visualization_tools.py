@@ -4,15 +4,92 @@ Visualization tools for MCP providing dashboard and pattern visualization capabi
 
 from pathlib import Path
 from typing import Any, Optional, Union
-import json
 import asyncio
+import itertools
+import logging
+import time
 from datetime import datetime
 
+import orjson
+
 from anthropic.types.beta import BetaToolUnionParam
 
 from ..base import BaseCognitiveTool, CognitiveToolResult
 from ...visualization import run_dashboard, PatternVisualizer
 
+logger = logging.getLogger(__name__)
+
+# numpy arrays and naive datetimes are common in visualization data
+_DUMPS_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode visualization data as JSON."""
+    return orjson.dumps(data, option=_DUMPS_OPTIONS)
+
+
+# Distinguishes files written within the same second
+_VIZ_COUNTER = itertools.count()
+
+
+def _file_stamp() -> str:
+    """Unique, filename-safe UTC timestamp for an output file."""
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}_{next(_VIZ_COUNTER):06d}"
+
+
+# Arguments each operation requires
+_REQUIRED_ARGS = {
+    'dashboard': frozenset({'data'}),
+    'pattern': frozenset({'data', 'pattern_type'}),
+    'save': frozenset({'data'})
+}
+
+# JSON schema of the tool's arguments
+_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["dashboard", "pattern", "save"],
+            "description": "Operation to perform"
+        },
+        "data": {
+            "type": "object",
+            "description": (
+                "Data to visualize. For 'dashboard', Python callers may pass "
+                "already encoded JSON bytes, which are written to the data "
+                "file as is"
+            )
+        },
+        "pattern_type": {
+            "type": "string",
+            "description": "Type of pattern to visualize"
+        },
+        "title": {
+            "type": "string",
+            "description": "Title for the visualization"
+        },
+        "description": {
+            "type": "string",
+            "description": "Description of the visualization"
+        },
+        "output_format": {
+            "type": "string",
+            "enum": ["html", "png", "svg"],
+            "description": "Format for saving visualization"
+        }
+    },
+    "required": ["operation", "data"]
+}
+
+
+def _log_dashboard_exit(task: "asyncio.Task[None]"):
+    """Log the error a background dashboard task failed with, if any."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Dashboard failed", exc_info=task.exception())
+
 
 class VisualizationTool(BaseCognitiveTool):
     """Tool for visualization operations including dashboards and pattern visualization."""
@@ -31,6 +108,22 @@ class VisualizationTool(BaseCognitiveTool):
         self._pattern_viz = PatternVisualizer()
         self._active_dashboard = None
 
+        # Handler of each operation and the arguments passed on to it
+        self._dispatch = {
+            'dashboard': (
+                self._run_dashboard,
+                ('data', 'title', 'description')
+            ),
+            'pattern': (
+                self._visualize_pattern,
+                ('data', 'pattern_type', 'title', 'description')
+            ),
+            'save': (
+                self._save_visualization,
+                ('data', 'output_format', 'title')
+            )
+        }
+
     def __call__(self, **kwargs) -> CognitiveToolResult:
         """Execute a visualization operation.
 
@@ -48,33 +141,11 @@ class VisualizationTool(BaseCognitiveTool):
                 error="Invalid arguments provided"
             )
 
-        operation = kwargs.get('operation')
+        handler, arg_names = self._dispatch[kwargs['operation']]
         try:
-            if operation == 'dashboard':
-                result = self._run_dashboard(
-                    kwargs['data'],
-                    kwargs.get('title', 'MCP Dashboard'),
-                    kwargs.get('description', '')
-                )
-            elif operation == 'pattern':
-                result = self._visualize_pattern(
-                    kwargs['data'],
-                    kwargs['pattern_type'],
-                    kwargs.get('title', ''),
-                    kwargs.get('description', '')
-                )
-            elif operation == 'save':
-                result = self._save_visualization(
-                    kwargs['data'],
-                    kwargs.get('output_format', 'html'),
-                    kwargs.get('title', '')
-                )
-            else:
-                return CognitiveToolResult(
-                    success=False,
-                    error=f"Unknown operation: {operation}"
-                )
-
+            result = handler(**{
+                name: kwargs[name] for name in arg_names if name in kwargs
+            })
             return CognitiveToolResult(
                 success=True,
                 data=result
@@ -92,87 +163,72 @@ class VisualizationTool(BaseCognitiveTool):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["dashboard", "pattern", "save"],
-                            "description": "Operation to perform"
-                        },
-                        "data": {
-                            "type": "object",
-                            "description": "Data to visualize"
-                        },
-                        "pattern_type": {
-                            "type": "string",
-                            "description": "Type of pattern to visualize"
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Title for the visualization"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Description of the visualization"
-                        },
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["html", "png", "svg"],
-                            "description": "Format for saving visualization"
-                        }
-                    },
-                    "required": ["operation", "data"]
-                }
+                "parameters": _PARAMETERS
             }
         }
 
     def validate_args(self, **kwargs) -> bool:
         """Validate the arguments for this tool."""
-        if 'operation' not in kwargs or 'data' not in kwargs:
-            return False
-
-        operation = kwargs['operation']
-        if operation == 'pattern' and 'pattern_type' not in kwargs:
-            return False
-
-        return True
+        required = _REQUIRED_ARGS.get(kwargs.get('operation'))
+        return required is not None and required.issubset(kwargs)
 
     def _run_dashboard(
         self,
         data: Any,
-        title: str,
-        description: str
+        title: str = 'MCP Dashboard',
+        description: str = ''
     ) -> dict[str, Any]:
-        """Run the MCP dashboard with the provided data."""
+        """Run the MCP dashboard with the provided data.
+
+        The data file is written before the dashboard starts. Inside a running
+        event loop the dashboard then runs on a worker thread as a background
+        task; otherwise it runs in the calling thread until it exits.
+
+        data may be JSON the caller has already encoded, as bytes. It is then
+        written to the data file unchanged, without the title, description
+        and timestamp wrapper.
+        """
         # Store the dashboard data
         dashboard_file = self.output_dir / 'dashboard_data.json'
-        dashboard_file.write_text(json.dumps({
-            'title': title,
-            'description': description,
-            'data': data,
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload = bytes(data)
+        else:
+            payload = _dumps({
+                'title': title,
+                'description': description,
+                'data': data,
+                'timestamp': datetime.utcnow().isoformat()
+            })
+
+        dashboard_file.write_bytes(payload)
 
-        # Run the dashboard in the background
         if self._active_dashboard:
             self._active_dashboard.cancel()
+            self._active_dashboard = None
 
-        self._active_dashboard = asyncio.create_task(
-            run_dashboard(data, title=title, description=description)
-        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            run_dashboard()
+            status = 'stopped'
+        else:
+            # Run the dashboard in the background, off the event loop
+            self._active_dashboard = loop.create_task(asyncio.to_thread(run_dashboard))
+            self._active_dashboard.add_done_callback(_log_dashboard_exit)
+            status = 'running'
 
         return {
-            'status': 'running',
-            'data_file': str(dashboard_file)
+            'status': status,
+            'data_file': str(dashboard_file),
+            'size': len(payload)
         }
 
     def _visualize_pattern(
         self,
         data: Any,
         pattern_type: str,
-        title: str,
-        description: str
+        title: str = '',
+        description: str = ''
     ) -> dict[str, Any]:
         """Visualize a pattern in the data."""
         # Generate the visualization
@@ -184,17 +240,20 @@ class VisualizationTool(BaseCognitiveTool):
         )
 
         # Store the visualization data
-        output_file = self.output_dir / f'pattern_{datetime.utcnow().isoformat()}.json'
-        output_file.write_text(json.dumps({
+        output_file = self.output_dir / f'pattern_{_file_stamp()}.json'
+        # Encoded once, straight to bytes; the dict is returned as is
+        payload = _dumps({
             'pattern_type': pattern_type,
             'title': title,
             'description': description,
             'data': viz_data
-        }))
+        })
+        output_file.write_bytes(payload)
 
         return {
             'visualization': viz_data,
-            'output_file': str(output_file)
+            'output_file': str(output_file),
+            'size': len(payload)
         }
 
     def _save_visualization(
@@ -204,7 +263,7 @@ class VisualizationTool(BaseCognitiveTool):
         title: str = ''
     ) -> dict[str, Any]:
         """Save a visualization in the specified format."""
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = _file_stamp()
         base_name = f"{title.lower().replace(' ', '_')}_{timestamp}" if title else f"viz_{timestamp}"
         output_file = self.output_dir / f"{base_name}.{output_format}"
 
@@ -3,8 +3,6 @@ Pytest configuration and shared fixtures for MCP tests.
 """
 
 import os
-import shutil
-import tempfile
 from pathlib import Path
 from typing import Generator, Any
 
@@ -23,11 +21,13 @@ from mcp.tools.integrated import (
 
 
 @pytest.fixture(scope="session")
-def workspace_root() -> Path:
-    """Provide a temporary workspace root directory for tests."""
-    temp_dir = tempfile.mkdtemp(prefix="mcp_test_")
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def workspace_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a temporary workspace root directory for tests.
+
+    Pytest removes old base temp directories itself, keeping the last few
+    runs for debugging, so nothing is deleted at the end of the session.
+    """
+    return tmp_path_factory.mktemp("mcp_test")
 
 
 @pytest.fixture(scope="session")
@@ -58,12 +58,20 @@ def memory_tool(memory_storage: Path) -> MemoryTool:
     return MemoryTool(storage_dir=memory_storage)
 
 
-@pytest.fixture
-def viz_tool(viz_output: Path) -> VisualizationTool:
-    """Provide a configured VisualizationTool instance."""
+@pytest.fixture(scope="session")
+def _viz_tool_singleton(viz_output: Path) -> VisualizationTool:
+    """VisualizationTool shared by the tests, constructed once."""
     return VisualizationTool(output_dir=viz_output)
 
 
+@pytest.fixture
+def viz_tool(_viz_tool_singleton: VisualizationTool, tmp_path: Path) -> VisualizationTool:
+    """Provide a configured VisualizationTool instance writing to a fresh
+    output directory."""
+    _viz_tool_singleton.output_dir = tmp_path
+    return _viz_tool_singleton
+
+
 @pytest.fixture
 def adv_tool(workspace_root: Path, memory_tool: MemoryTool) -> AdvancedDeveloperTools:
     """Provide a configured AdvancedDeveloperTools instance."""
@@ -73,12 +81,22 @@ def adv_tool(workspace_root: Path, memory_tool: MemoryTool) -> AdvancedDeveloper
     )
 
 
-@pytest.fixture
-def ctrl_tool(workspace_root: Path) -> ComputerControlTool:
-    """Provide a configured ComputerControlTool instance."""
+@pytest.fixture(scope="session")
+def _ctrl_tool_singleton(workspace_root: Path) -> ComputerControlTool:
+    """ComputerControlTool shared by the tests, so platform setup runs once."""
     return ComputerControlTool(cache_dir=workspace_root / "cache")
 
 
+@pytest.fixture
+def ctrl_tool(_ctrl_tool_singleton: ComputerControlTool, tmp_path: Path) -> ComputerControlTool:
+    """Provide a configured ComputerControlTool instance with an empty
+    cache."""
+    _ctrl_tool_singleton.cache_dir = tmp_path
+    _ctrl_tool_singleton.http_cache_dir = tmp_path / "http"
+    _ctrl_tool_singleton.http_cache_dir.mkdir(exist_ok=True)
+    return _ctrl_tool_singleton
+
+
 @pytest.fixture(scope="session")
 def docker_client() -> docker.DockerClient:
     """Provide a Docker client for container tests."""
@@ -165,15 +165,17 @@ def test_e2e():
 @pytest.mark.benchmark
 def test_performance(benchmark: Any):
     """Test performance of development operations."""
+    # Construct the tool outside the timed function so only the call is measured
+    tool = AdvancedDeveloperTools()
+
     def run_lint():
-        tool = AdvancedDeveloperTools()
         return tool(
             operation="lint",
             lint_type="black",
             store_results=False
         )
 
-    result = benchmark(run_lint)
+    result = benchmark.pedantic(run_lint, rounds=100, warmup_rounds=5)
     assert result.success
 
 
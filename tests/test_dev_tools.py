@@ -0,0 +1,27 @@
+"""
+Tests for the DeveloperTool shell operation.
+"""
+
+import sys
+
+from mcp.tools.integrated import DeveloperTool
+
+
+def test_shell_output_with_invalid_utf8(dev_tool: DeveloperTool):
+    """Bytes that aren't UTF-8 are replaced rather than stalling the command."""
+    result = dev_tool(
+        operation="shell",
+        command=[
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write(b'ok \\xff\\n'); "
+            "sys.stderr.buffer.write(b'\\xfe\\n')"
+        ],
+        timeout=30
+    )
+
+    assert result.success
+    assert result.data["returncode"] == 0
+    assert not result.data["timed_out"]
+    assert "ok �" in result.data["stdout"]
+    assert "�" in result.data["stderr"]
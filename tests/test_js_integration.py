@@ -0,0 +1,46 @@
+"""
+Tests for framing of the Node.js integration's stdin protocol.
+"""
+
+import asyncio
+from typing import List, Union
+
+import pytest
+
+from mcp.tools import js_integration
+
+
+async def _read_all(data: bytes, limit: int, chunk_size: int) -> List[Union[bytes, str]]:
+    """Feed data to a reader in chunks and collect frames, with 'error' for
+    each rejected frame."""
+    reader = asyncio.StreamReader(limit=limit)
+
+    async def feed():
+        for i in range(0, len(data), chunk_size):
+            reader.feed_data(data[i:i + chunk_size])
+            await asyncio.sleep(0)
+        reader.feed_eof()
+
+    feeder = asyncio.create_task(feed())
+    frames: List[Union[bytes, str]] = []
+    while True:
+        try:
+            frame = await js_integration._read_frame(reader)
+        except ValueError:
+            frames.append("error")
+            continue
+        if not frame:
+            break
+        frames.append(frame)
+    await feeder
+    return frames
+
+
+@pytest.mark.parametrize("chunk_size", [64, 4096])
+def test_oversized_frame_is_rejected_once(chunk_size: int):
+    """An oversized frame gets exactly one error and the next frame is intact."""
+    data = b"x" * 1000 + b"\n" + b'{"action": "get_state"}\n'
+
+    frames = asyncio.run(_read_all(data, limit=100, chunk_size=chunk_size))
+
+    assert frames == ["error", b'{"action": "get_state"}\n']
@@ -0,0 +1,61 @@
+"""
+Tests for the VisualizationTool dashboard operation.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import orjson
+import pytest
+
+from mcp.tools.integrated import VisualizationTool
+from mcp.tools.integrated import visualization_tools
+
+
+@pytest.fixture
+def dashboard_runs(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Replace the Streamlit dashboard with a stub that records its runs."""
+    runs: List[int] = []
+    monkeypatch.setattr(visualization_tools, "run_dashboard", lambda: runs.append(1))
+    return runs
+
+
+def test_dashboard_writes_data_file(viz_tool: VisualizationTool, dashboard_runs: List[int]):
+    """The data file exists once the call returns, without an event loop."""
+    result = viz_tool(operation="dashboard", data={"a": 1}, title="T")
+
+    assert result.success
+    assert result.data["status"] == "stopped"
+    payload = orjson.loads(Path(result.data["data_file"]).read_bytes())
+    assert payload["title"] == "T"
+    assert payload["data"] == {"a": 1}
+    assert dashboard_runs == [1]
+
+
+def test_dashboard_writes_encoded_bytes_unchanged(
+    viz_tool: VisualizationTool,
+    dashboard_runs: List[int]
+):
+    """Pre-encoded JSON bytes reach the data file as is, without the envelope."""
+    encoded = b'{"points": [1, 2, 3]}'
+    result = viz_tool(operation="dashboard", data=encoded)
+
+    assert result.success
+    assert Path(result.data["data_file"]).read_bytes() == encoded
+    assert result.data["size"] == len(encoded)
+
+
+def test_dashboard_in_running_loop(viz_tool: VisualizationTool, dashboard_runs: List[int]):
+    """Inside an event loop the file is written before the dashboard task runs."""
+    async def run():
+        result = viz_tool(operation="dashboard", data={"a": 1})
+        assert Path(result.data["data_file"]).exists()
+        await viz_tool._active_dashboard
+        return result
+
+    result = asyncio.run(run())
+
+    assert result.success
+    assert result.data["status"] == "running"
+    assert dashboard_runs == [1]